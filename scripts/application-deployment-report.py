@@ -5,74 +5,181 @@ Shows which deployments use each application, including cluster group informatio
 Also identifies applications not used in any deployment
 """
 
+import hashlib
 import os
 import sys
+import json
+import re
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Set
+from urllib3.util.retry import Retry
 
-def get_all_deployments() -> List[Dict[str, Any]]:
-    """Get all deployments with full details"""
-    api_key = os.getenv('SC_FM_APIKEY')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PAGE_SIZE = 200
+
+# Shared empty mapping for lookups of unknown application IDs (never mutated)
+EMPTY: Dict[str, Any] = {}
+
+# Cluster group suffix on deployment names: the last '-' separated token starting with DD
+CLUSTER_GROUP_SUFFIX_RE = re.compile(r'-(DD[^-]*)$')
+
+# Maximum number of deployment detail requests in flight at once
+DETAIL_FETCH_CONCURRENCY = 20
+
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# On-disk cache of GET responses so repeated report runs within the TTL skip the API
+CACHE_DIR = '.cache'
+CACHE_TTL_SECONDS = 60
+
+_cache: Dict[str, Dict[str, Any]] = {}
+_cache_enabled = True
+
+def cache_file() -> str:
+    """Cache path for the current API URL and key, so switching org never serves another tenant's data"""
     api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
+    scope = hashlib.sha256(f"{api_url}\n{os.getenv('SC_FM_APIKEY', '')}".encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"fm_report_{scope}.json")
+
+def load_cache(enabled: bool = True) -> None:
+    """Load unexpired GET responses from the on-disk cache (or disable caching)"""
+    global _cache_enabled
+    _cache_enabled = enabled
+    path = cache_file()
+    if not enabled or not os.path.exists(path):
+        return
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
-    
-    deployments = []
-    url = f"{api_url}/deployments?limit=50"
-    
-    while url:
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            deployments.extend(data.get('items', []))
-            url = data.get('next')
-        except Exception as e:
-            print(f"❌ Error fetching deployments: {e}")
-            break
+    try:
+        with open(path, 'r') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
     
-    return deployments
+    now = time.time()
+    _cache.update({
+        url: entry for url, entry in entries.items()
+        if now - entry.get('fetched_at', 0) < CACHE_TTL_SECONDS
+    })
 
-def get_deployment_details(dep_id: str) -> Dict[str, Any]:
-    """Get full details for a specific deployment"""
-    api_key = os.getenv('SC_FM_APIKEY')
-    api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
-    
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
+def save_cache() -> None:
+    """Persist cached GET responses for the next run"""
+    if not _cache_enabled:
+        return
     
+    path = cache_file()
     try:
-        response = requests.get(f"{api_url}/deployments/{dep_id}", headers=headers, timeout=30)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {'error': f"HTTP {response.status_code}: {response.text}"}
-    except Exception as e:
-        return {'error': f"Request error: {e}"}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(_cache, f)
+    except OSError as e:
+        print(f"⚠️  Could not write cache file {path}: {e}")
 
-def get_all_applications() -> Dict[str, Dict[str, Any]]:
-    """Get all applications and return as a dict keyed by ID"""
-    api_key = os.getenv('SC_FM_APIKEY')
-    api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
-    
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
+class FleetClient:
+    """Fleet Manager API client that reads config once and reuses a pooled session"""
+    
+    def __init__(self):
+        self.api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
+        self.headers = {
+            'accept': 'application/json',
+            'api-key': os.getenv('SC_FM_APIKEY')
+        }
+        
+        # Every API call reuses pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=DETAIL_FETCH_CONCURRENCY,
+            pool_maxsize=DETAIL_FETCH_CONCURRENCY,
+            max_retries=RETRY_POLICY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def fetch_json(self, url: str) -> Any:
+        """GET a URL and return its JSON body, served from the cache while fresh"""
+        if _cache_enabled:
+            entry = _cache.get(url)
+            if entry and time.time() - entry['fetched_at'] < CACHE_TTL_SECONDS:
+                return entry['data']
+        
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        
+        if _cache_enabled:
+            _cache[url] = {'fetched_at': time.time(), 'data': data}
+        return data
     
-    applications = {}
-    url = f"{api_url}/deployment-applications?limit=50"
+    def get_all_deployments(self) -> List[Dict[str, Any]]:
+        """Get all deployments with full details
+
+        Raises on a failed page (after retries) so a partial listing is never
+        reported as complete.
+        """
+        deployments = []
+        # Ask the list endpoint to inline application references so no per-deployment fetch is needed
+        url = f"{self.api_url}/deployments?limit={PAGE_SIZE}&expand=applications"
+        
+        while url:
+            try:
+                data = self.fetch_json(url)
+            except requests.HTTPError as e:
+                if e.response.status_code == 400 and not deployments and 'expand=' in url:
+                    # API does not support expand - fall back to the plain listing
+                    url = f"{self.api_url}/deployments?limit={PAGE_SIZE}"
+                    continue
+                print(f"❌ Error fetching deployments: {e}")
+                raise
+            
+            deployments.extend(data.get('items', []))
+            url = data.get('next')
+        
+        return deployments
     
-    while url:
+    def get_deployment_details(self, dep_id: str) -> Dict[str, Any]:
+        """Get full details for a specific deployment"""
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            return self.fetch_json(f"{self.api_url}/deployments/{dep_id}")
+        except requests.HTTPError as e:
+            return {'error': f"HTTP {e.response.status_code}: {e.response.text}"}
+        except Exception as e:
+            return {'error': f"Request error: {e}"}
+    
+    def get_all_deployment_details(self, dep_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch full details for many deployments concurrently, keyed by deployment ID"""
+        if not dep_ids:
+            return {}
+        
+        workers = min(DETAIL_FETCH_CONCURRENCY, len(dep_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            details = list(executor.map(self.get_deployment_details, dep_ids))
+        
+        return dict(zip(dep_ids, details))
+    
+    def get_all_applications(self) -> Dict[str, Dict[str, Any]]:
+        """Get all applications and return as a dict keyed by ID"""
+        applications = {}
+        url = f"{self.api_url}/deployment-applications?limit={PAGE_SIZE}"
+        
+        while url:
+            try:
+                data = self.fetch_json(url)
+            except requests.HTTPError as e:
+                print(f"❌ Error fetching applications: {e}")
+                raise
             
             for app in data.get('items', []):
                 app_id = app.get('id')
@@ -80,64 +187,59 @@ def get_all_applications() -> Dict[str, Dict[str, Any]]:
                     applications[app_id] = app
             
             url = data.get('next')
-        except Exception as e:
-            print(f"❌ Error fetching applications: {e}")
-            break
-    
-    return applications
+        
+        return applications
 
 def extract_cluster_group_from_deployment(deployment: Dict[str, Any]) -> str:
     """Extract cluster group information from deployment"""
-    # Try to extract cluster group from deployment name or other fields
-    dep_name = deployment.get('name', '')
-    
-    # Look for cluster group patterns in deployment name (e.g., nginx-DDvsns)
-    if '-' in dep_name:
-        parts = dep_name.split('-')
-        if len(parts) > 1:
-            # Last part might be cluster group
-            potential_cluster = parts[-1]
-            # Common cluster group patterns
-            if potential_cluster in ['DDvsns', 'DDGroup', 'DDLab', 'DDTest'] or potential_cluster.startswith('DD'):
-                return potential_cluster
-    
-    # Check if there's a targetGroup field
-    target_group = deployment.get('targetGroup')
-    if target_group:
-        return target_group
-    
-    # Check if there's a cluster field
-    cluster = deployment.get('cluster')
-    if cluster:
-        return cluster
-    
-    return 'Unknown'
+    # Look for a cluster group suffix in the deployment name (e.g., nginx-DDvsns)
+    match = CLUSTER_GROUP_SUFFIX_RE.search(deployment.get('name', ''))
+    if match:
+        return match.group(1)
+    
+    # Fall back to the targetGroup field, then the cluster field
+    return deployment.get('targetGroup') or deployment.get('cluster') or 'Unknown'
 
-def generate_application_deployment_report():
+def generate_application_deployment_report(use_cache: bool = True):
     """Generate comprehensive application-deployment relationship report"""
     
     if not os.getenv('SC_FM_APIKEY'):
         print("❌ SC_FM_APIKEY environment variable is required")
         return
     
+    load_cache(use_cache)
+    client = FleetClient()
+    
     print("🔍 Generating Application-Deployment Relationship Report...")
     print("   (Analyzing all applications and their deployment usage)")
     print()
     
     # Get all data
     print("📋 Fetching all applications...")
-    applications = get_all_applications()
+    applications = client.get_all_applications()
     print(f"   Found {len(applications)} applications")
     
     print("📋 Fetching all deployments...")
-    deployments = get_all_deployments()
+    deployments = client.get_all_deployments()
     print(f"   Found {len(deployments)} deployments")
+    
+    # List entries that already carry 'applications' are used as-is; only the rest need a detail GET
+    missing_ids = [d.get('id', 'Unknown') for d in deployments if 'applications' not in d]
+    if missing_ids:
+        # Logged once so it is obvious when the list endpoint is not returning application references
+        print(f"ℹ️  {len(missing_ids)} of {len(deployments)} deployment(s) listed without 'applications' "
+              f"- falling back to per-deployment detail requests")
+    details = client.get_all_deployment_details(missing_ids)
+    for deployment in deployments:
+        details.setdefault(deployment.get('id', 'Unknown'), deployment)
+    save_cache()
     print()
     
     # Build application usage map
     print("🔍 Analyzing application-deployment relationships...")
     app_usage = {}  # app_id -> list of deployment info
-    used_app_ids = set()
+    cluster_groups = set()
+    app_counts = []  # number of applications per deployment, aligned with deployments
     
     for i, deployment in enumerate(deployments, 1):
         dep_name = deployment.get('name', 'Unknown')
@@ -146,11 +248,12 @@ def generate_application_deployment_report():
         
         print(f"[{i:2d}/{len(deployments)}] {dep_name}")
         
-        # Get full deployment details
-        full_deployment = get_deployment_details(dep_id)
+        # Full deployment details were fetched concurrently up front
+        full_deployment = details[dep_id]
         
         if 'error' in full_deployment:
             print(f"    ❌ ERROR: {full_deployment['error']}")
+            app_counts.append(0)
             continue
         
         # Extract cluster group
@@ -158,18 +261,15 @@ def generate_application_deployment_report():
         
         # Get applications referenced by this deployment
         applications_refs = full_deployment.get('applications', [])
+        app_counts.append(len(applications_refs))
         
         for app_ref in applications_refs:
             app_id = app_ref.get('id')
             app_name = app_ref.get('name', 'Unknown')
             
             if app_id:
-                used_app_ids.add(app_id)
-                
-                if app_id not in app_usage:
-                    app_usage[app_id] = []
-                
-                app_usage[app_id].append({
+                cluster_groups.add(cluster_group)
+                app_usage.setdefault(app_id, []).append({
                     'deployment_name': dep_name,
                     'deployment_id': dep_id,
                     'deployment_status': dep_status,
@@ -187,71 +287,87 @@ def generate_application_deployment_report():
     print("📊 APPLICATION-DEPLOYMENT RELATIONSHIP REPORT")
     print("=" * 100)
     
-    # Report applications used in deployments
-    print(f"📋 APPLICATIONS USED IN DEPLOYMENTS ({len(app_usage)} applications)")
-    print()
+    # Report applications used in deployments (buffered and written once per section)
+    lines = [f"📋 APPLICATIONS USED IN DEPLOYMENTS ({len(app_usage)} applications)", ""]
     
-    for app_id, deployment_list in sorted(app_usage.items(), key=lambda x: applications.get(x[0], {}).get('name', 'Unknown')):
-        app_name = applications.get(app_id, {}).get('name', 'Unknown')
-        app_source_type = applications.get(app_id, {}).get('sourceType', 'Unknown')
+    # Decorate with the sort key once instead of looking it up inside the sort comparator
+    decorated = [
+        (applications.get(app_id, EMPTY).get('name', 'Unknown'), app_id, deployment_list)
+        for app_id, deployment_list in app_usage.items()
+    ]
+    decorated.sort()  # app IDs are unique, so ties never reach the deployment lists
+    
+    for app_name, app_id, deployment_list in decorated:
+        app = applications.get(app_id, EMPTY)
+        app_source_type = app.get('sourceType', 'Unknown')
         
-        print(f"🔧 {app_name}")
-        print(f"   ID: {app_id}")
-        print(f"   Source Type: {app_source_type}")
+        lines.append(f"🔧 {app_name}")
+        lines.append(f"   ID: {app_id}")
+        lines.append(f"   Source Type: {app_source_type}")
         
         # Check if this is a GitOps-managed application
-        app_description = applications.get(app_id, {}).get('description') or ''
+        app_description = app.get('description') or ''
         if app_source_type == 'gitops':
-            print(f"   📍 GitOps Managed: {app_description}")
+            lines.append(f"   📍 GitOps Managed: {app_description}")
         elif app_description and ('gitops' in app_description.lower() or 'github' in app_description.lower()):
-            print(f"   📍 GitOps Managed: {app_description}")
+            lines.append(f"   📍 GitOps Managed: {app_description}")
         elif app_source_type == 'editor':
-            print(f"   📝 Manually Created (Editor)")
+            lines.append(f"   📝 Manually Created (Editor)")
         else:
-            print(f"   🔗 API Created ({app_source_type})")
+            lines.append(f"   🔗 API Created ({app_source_type})")
             
-        print(f"   Used in {len(deployment_list)} deployment(s):")
+        lines.append(f"   Used in {len(deployment_list)} deployment(s):")
         
         for dep_info in deployment_list:
-            print(f"     • {dep_info['deployment_name']} ({dep_info['cluster_group']}) - {dep_info['deployment_status']}")
+            lines.append(f"     • {dep_info['deployment_name']} ({dep_info['cluster_group']}) - {dep_info['deployment_status']}")
         
-        print()
+        lines.append("")
     
-    # Report orphaned applications (not used in any deployment)
-    orphaned_app_ids = set(applications.keys()) - used_app_ids
-    orphaned_applications = [applications[app_id] for app_id in orphaned_app_ids]
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    print("=" * 100)
-    print(f"📭 ORPHANED APPLICATIONS ({len(orphaned_applications)} applications)")
-    print("   (Applications not used in any deployment)")
-    print()
+    # Report orphaned applications (dict key views support set difference)
+    orphaned_applications = [
+        app for _, _, app in sorted(
+            (applications[app_id].get('name', 'Unknown'), app_id, applications[app_id])
+            for app_id in applications.keys() - app_usage.keys()
+        )
+    ]
+    
+    lines = [
+        "=" * 100,
+        f"📭 ORPHANED APPLICATIONS ({len(orphaned_applications)} applications)",
+        "   (Applications not used in any deployment)",
+        "",
+    ]
     
     if orphaned_applications:
-        for app in sorted(orphaned_applications, key=lambda x: x.get('name', 'Unknown')):
+        for app in orphaned_applications:
             app_name = app.get('name', 'Unknown')
             app_id = app.get('id', 'Unknown')
             app_source_type = app.get('sourceType', 'Unknown')
             app_description = app.get('description', '')
             created_at = app.get('createdAt', 'Unknown')
             
-            print(f"🔧 {app_name}")
-            print(f"   ID: {app_id}")
-            print(f"   Source Type: {app_source_type}")
+            lines.append(f"🔧 {app_name}")
+            lines.append(f"   ID: {app_id}")
+            lines.append(f"   Source Type: {app_source_type}")
             
             # Check if this is a GitOps-managed application
             if app_source_type == 'gitops':
-                print(f"   📍 GitOps Managed: {app_description}")
+                lines.append(f"   📍 GitOps Managed: {app_description}")
             elif app_description and ('gitops' in app_description.lower() or 'github' in app_description.lower()):
-                print(f"   📍 GitOps Managed: {app_description}")
+                lines.append(f"   📍 GitOps Managed: {app_description}")
             elif app_source_type == 'editor':
-                print(f"   📝 Manually Created (Editor)")
+                lines.append(f"   📝 Manually Created (Editor)")
             else:
-                print(f"   🔗 API Created ({app_source_type})")
+                lines.append(f"   🔗 API Created ({app_source_type})")
                 
-            print(f"   Created: {created_at}")
-            print()
+            lines.append(f"   Created: {created_at}")
+            lines.append("")
     else:
-        print("✅ No orphaned applications found - all applications are in use!")
+        lines.append("✅ No orphaned applications found - all applications are in use!")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("=" * 100)
     print("📊 SUMMARY STATISTICS")
@@ -261,12 +377,7 @@ def generate_application_deployment_report():
     print(f"Orphaned Applications: {len(orphaned_applications)}")
     print(f"Total Deployments: {len(deployments)}")
     
-    # Cluster group summary
-    cluster_groups = set()
-    for deployment_list in app_usage.values():
-        for dep_info in deployment_list:
-            cluster_groups.add(dep_info['cluster_group'])
-    
+    # Cluster group summary (collected during the main deployment pass)
     print(f"Cluster Groups in Use: {len(cluster_groups)}")
     if cluster_groups:
         print(f"Cluster Groups: {', '.join(sorted(cluster_groups))}")
@@ -285,26 +396,19 @@ def generate_application_deployment_report():
             app_name = applications.get(app_id, {}).get('name', 'Unknown')
             print(f"     • {app_name}: {len(deployment_list)} deployment(s)")
     
-    # Find deployments using multiple applications
-    multi_app_deployments = []
-    for deployment in deployments:
-        full_deployment = get_deployment_details(deployment.get('id'))
-        if 'error' not in full_deployment:
-            app_refs = full_deployment.get('applications', [])
-            if len(app_refs) > 1:
-                multi_app_deployments.append({
-                    'name': deployment.get('name'),
-                    'app_count': len(app_refs)
-                })
-    
+    # Find deployments using multiple applications (largest first)
+    multi_app_deployments = sorted(
+        ((deployment.get('name'), count) for deployment, count in zip(deployments, app_counts) if count > 1),
+        key=lambda x: -x[1]
+    )
     if multi_app_deployments:
         print(f"   - {len(multi_app_deployments)} deployment(s) use multiple applications")
-        for dep in multi_app_deployments[:3]:  # Show top 3
-            print(f"     • {dep['name']}: {dep['app_count']} application(s)")
+        for dep_name, app_count in multi_app_deployments[:3]:  # Show top 3
+            print(f"     • {dep_name}: {app_count} application(s)")
 
 def main():
     if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
-        print("Usage: python3 application-deployment-report.py")
+        print("Usage: python3 application-deployment-report.py [--no-cache]")
         print()
         print("This script generates a comprehensive report showing:")
         print("  - All applications and which deployments use them")
@@ -315,9 +419,16 @@ def main():
         print("Requirements:")
         print("  - SC_FM_APIKEY environment variable must be set")
         print("  - Network access to Fleet Manager API")
+        print()
+        print("Options:")
+        print(f"  --no-cache    Always query the API (responses are otherwise reused for {CACHE_TTL_SECONDS}s under {CACHE_DIR}/)")
         return
     
-    generate_application_deployment_report()
+    try:
+        generate_application_deployment_report(use_cache='--no-cache' not in sys.argv[1:])
+    except requests.RequestException as e:
+        print(f"❌ Report aborted - could not fetch complete data: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -7,7 +7,26 @@ import os
 import sys
 import requests
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import List, Dict
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PAGE_SIZE = 200
+DELETE_CONCURRENCY = 16
+
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
 
 class TestAppCleanup:
     def __init__(self):
@@ -22,28 +41,45 @@ class TestAppCleanup:
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
-    
-    def get_test_applications(self) -> List[Dict]:
-        """Get all test applications (those ending with -test)"""
-        print("🔍 Finding test applications...")
         
-        applications = []
-        url = f"{self.fm_api_url}/deployment-applications"
+        # Pooled session shared by the list and delete calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=RETRY_POLICY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def _list_items(self, path: str, label: str) -> List[Dict]:
+        """Page through a list endpoint, following the 'next' cursor"""
+        url = f"{self.fm_api_url}/{path}?limit={PAGE_SIZE}"
+        items = []
         
         while url:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             if response.status_code != 200:
-                print(f"❌ Failed to fetch applications: {response.status_code}")
-                return []
-            
-            data = response.json()
-            for app in data.get('items', []):
-                app_name = app.get('name', '')
-                if app_name.endswith('-test'):
-                    applications.append(app)
+                # Fail loudly rather than acting on a partial listing
+                print(f"❌ Failed to fetch {label}: {response.status_code}")
+                raise requests.HTTPError(f"GET {url} returned HTTP {response.status_code}", response=response)
             
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            items.extend(data.get('items', []))
             url = data.get('next')
         
+        return items
+    
+    def get_test_applications(self) -> List[Dict]:
+        """Get all test applications (those ending with -test)"""
+        print("🔍 Finding test applications...")
+        
+        applications = [
+            app for app in self._list_items('deployment-applications', 'applications')
+            if app.get('name', '').endswith('-test')
+        ]
+        
         print(f"📋 Found {len(applications)} test applications")
         return applications
     
@@ -51,22 +87,10 @@ class TestAppCleanup:
         """Get all test deployments (those ending with -test)"""
         print("🔍 Finding test deployments...")
         
-        deployments = []
-        url = f"{self.fm_api_url}/deployments"
-        
-        while url:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code != 200:
-                print(f"❌ Failed to fetch deployments: {response.status_code}")
-                return []
-            
-            data = response.json()
-            for dep in data.get('items', []):
-                dep_name = dep.get('name', '')
-                if '-test-' in dep_name:
-                    deployments.append(dep)
-            
-            url = data.get('next')
+        deployments = [
+            dep for dep in self._list_items('deployments', 'deployments')
+            if '-test-' in dep.get('name', '')
+        ]
         
         print(f"📋 Found {len(deployments)} test deployments")
         return deployments
@@ -74,7 +98,7 @@ class TestAppCleanup:
     def delete_application(self, app_id: str, app_name: str) -> bool:
         """Delete an application"""
         url = f"{self.fm_api_url}/deployment-applications/{app_id}"
-        response = requests.delete(url, headers=self.headers)
+        response = self.session.delete(url)
         
         if response.status_code == 204:
             print(f"✅ Deleted application: {app_name}")
@@ -86,7 +110,7 @@ class TestAppCleanup:
     def delete_deployment(self, dep_id: str, dep_name: str) -> bool:
         """Delete a deployment"""
         url = f"{self.fm_api_url}/deployments/{dep_id}"
-        response = requests.delete(url, headers=self.headers)
+        response = self.session.delete(url)
         
         if response.status_code == 204:
             print(f"✅ Deleted deployment: {dep_name}")
@@ -139,21 +163,14 @@ class TestAppCleanup:
             print("✅ Nothing to delete")
             return
         
-        # Delete deployments first (they depend on applications)
-        deleted_deployments = 0
-        for dep in test_deployments:
-            dep_name = dep.get('name', 'unknown')
-            dep_id = dep.get('id', 'unknown')
-            if self.delete_deployment(dep_id, dep_name):
-                deleted_deployments += 1
-        
-        # Delete applications
-        deleted_apps = 0
-        for app in test_apps:
-            app_name = app.get('name', 'unknown')
-            app_id = app.get('id', 'unknown')
-            if self.delete_application(app_id, app_name):
-                deleted_apps += 1
+        with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as executor:
+            # Delete deployments first (they depend on applications)
+            dep_jobs = [(dep.get('id', 'unknown'), dep.get('name', 'unknown')) for dep in test_deployments]
+            deleted_deployments = sum(executor.map(lambda job: self.delete_deployment(*job), dep_jobs))
+            
+            # Delete applications once all deployments are gone
+            app_jobs = [(app.get('id', 'unknown'), app.get('name', 'unknown')) for app in test_apps]
+            deleted_apps = sum(executor.map(lambda job: self.delete_application(*job), app_jobs))
         
         print(f"\n📊 Cleanup Summary:")
         print(f"✅ Deleted {deleted_apps} test applications")
@@ -169,7 +186,11 @@ def main():
     args = parser.parse_args()
     
     cleanup = TestAppCleanup()
-    cleanup.cleanup_test_apps(dry_run=not args.execute)
+    try:
+        cleanup.cleanup_test_apps(dry_run=not args.execute)
+    except requests.RequestException as e:
+        print(f"❌ Cleanup aborted - could not list test items: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
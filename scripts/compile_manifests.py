@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
+import functools
+import hashlib
+import io
+import json
 import os
 import sys
+import textwrap
 import yaml
-import glob
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_BaseSafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
 """Configure YAML to render multi-line strings as literal blocks (|)."""
 try:
-    from yaml.dumper import SafeDumper as _BaseSafeDumper
-
     class LiteralString(str):
         pass
 
@@ -20,44 +30,76 @@ try:
             return super().represent_str(data)
 
     def _represent_literal_str(dumper, data):
-        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+        # The C emitter only accepts exact str scalars, not subclasses
+        return dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style='|')
 
     # Register for our custom type and ensure plain str uses our override
     yaml.add_representer(LiteralString, _represent_literal_str)
     LiteralSafeDumper.add_representer(LiteralString, _represent_literal_str)
     LiteralSafeDumper.add_representer(str, LiteralSafeDumper.represent_str)  # type: ignore[arg-type]
-    
-    # Debug: print YAML version info
-    import yaml
-    print(f"🔧 Using PyYAML version: {yaml.__version__}")
-    print(f"🔧 LiteralSafeDumper available: {LiteralSafeDumper is not None}")
+    _literal_setup_error = None
 except Exception as e:
-    # Fallbacks
-    print(f"⚠️  YAML literal block setup failed: {e}")
+    # Fallbacks; reported from main() so pool workers importing this module stay quiet
+    _literal_setup_error = e
     LiteralString = str  # type: ignore
     LiteralSafeDumper = None  # type: ignore
 
+# Below this many container definitions, compiling in-process beats starting a process pool
+PARALLEL_COMPILE_MIN_FILES = 8
+
+
+CONTAINERS_DIR = 'manifests/containers'
+RUNTIME_CONFIG_DIR = f'{CONTAINERS_DIR}/runtime_configuration'
+
+
+def _scan_dir(path: str):
+    """Visible regular files in path (glob-style: dotfiles skipped, missing dir is empty)."""
+    try:
+        with os.scandir(path) as it:
+            return [entry for entry in it if not entry.name.startswith('.') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+# allow_unicode keeps non-ASCII text (and thus | blocks) unescaped; the unbounded width
+# stops the emitter from analysing long scalars for line folding
+_DUMP_OPTIONS = dict(sort_keys=False, allow_unicode=True, default_flow_style=False, width=2**31 - 1)
+
+
 def load_yaml(path: str):
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+    # One read of the whole file; a file object would make the parser pull it in small chunks
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=_Loader)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path: str, mtime_ns: int):
+    """load_yaml memoized on (path, mtime); callers must treat the result as read-only."""
+    return load_yaml(path)
 
 
 def ensure_dir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
 
 
+# NIC used when the runtime configuration declares no network (read-only; copied per VM)
+_DEFAULT_NETWORK = ({'name': 'eth0', 'type': 'virtio'},)
+
+
 def to_application(container_def: dict, runtime_def: dict) -> dict:
-    name = container_def.get('metadata', {}).get('name')
-    md = container_def.get('metadata', {})
+    md = container_def.get('metadata') or {}
+    name = md.get('name')
+    cspec = container_def.get('spec') or {}
+    rspec = (runtime_def or {}).get('spec') or {}
     # Runtime defaults from runtime.yaml (can be overridden by container spec)
-    runtime_defaults = (runtime_def.get('spec', {}) or {}).get('runtime', {}) if runtime_def else {}
-    network = (runtime_def.get('spec', {}) or {}).get('network', []) if runtime_def else []
-    vm_state = (runtime_def.get('spec', {}) or {}).get('vmState', 'running') if runtime_def else 'running'
-    policies = (runtime_def.get('spec', {}) or {}).get('policies', {}) if runtime_def else {}
+    runtime_defaults = rspec.get('runtime', {})
+    network = rspec.get('network', [])
+    vm_state = rspec.get('vmState', 'running')
+    policies = rspec.get('policies', {})
     # Container overrides
-    container_runtime = (container_def.get('spec', {}) or {}).get('runtime', {})
-    containers = container_def.get('spec', {}).get('containers', [])
-    content = container_def.get('spec', {}).get('content', [])
+    container_runtime = cspec.get('runtime', {})
+    containers = cspec.get('containers', [])
+    content = cspec.get('content', [])
 
     # Merge runtime (container overrides runtime defaults)
     vcpus = container_runtime.get('vcpus') or runtime_defaults.get('vcpus', 2)
@@ -70,23 +112,22 @@ def to_application(container_def: dict, runtime_def: dict) -> dict:
     disk_image = merged_disk.get('imageUrl') or merged_disk.get('url')
     disk_format = merged_disk.get('format', 'raw')
 
-    # Map simplified to Application
-    tags = list(md.get('labels') or [])
+    # Map simplified to Application. tags must be its own list: sharing the labels
+    # list would make the dumper emit a YAML anchor/alias pair.
+    tags = list(md.get('labels') or ())
 
     # Merge cloudInit from runtime + container convenience fields
-    merged_cloud_init = {}
-    rc_cloud = (runtime_def.get('spec', {}).get('cloudInit') if runtime_def else {}) or {}
-    ct_cloud = (container_def.get('spec', {}).get('cloudInit') if container_def else {}) or {}
+    rc_cloud = rspec.get('cloudInit') or {}
+    ct_cloud = cspec.get('cloudInit') or {}
     # Allow top-level users/chpasswd in container spec
-    if container_def.get('spec', {}).get('users'):
-        ct_cloud['users'] = container_def['spec']['users']
-    if container_def.get('spec', {}).get('chpasswd'):
-        ct_cloud['chpasswd'] = container_def['spec']['chpasswd']
-    # Shallow-merge with runtime taking precedence for ssh settings
-    merged_cloud_init.update(ct_cloud)
-    merged_cloud_init.update(rc_cloud)
-
-    USER_DATA_PLACEHOLDER = "__USER_DATA_PLACEHOLDER__"
+    if cspec.get('users'):
+        ct_cloud['users'] = cspec['users']
+    if cspec.get('chpasswd'):
+        ct_cloud['chpasswd'] = cspec['chpasswd']
+    # Shallow-merge view with runtime taking precedence for ssh settings (no copying;
+    # the user_data builder only reads it)
+    merged_cloud_init = ChainMap(rc_cloud, ct_cloud)
+
     app = {
         'version': '1',
         'type': 'Application',
@@ -122,12 +163,12 @@ def to_application(container_def: dict, runtime_def: dict) -> dict:
                         ],
                         'network_devices': [
                             {'name': n.get('name', 'eth0'), 'type': n.get('type', 'virtio')}
-                            for n in (network or [{'name': 'eth0', 'type': 'virtio'}])
+                            for n in (network or _DEFAULT_NETWORK)
                         ],
                         'tags': tags,
                         'state': vm_state,
                         'cloud_init_data': {
-                            'user_data': USER_DATA_PLACEHOLDER,
+                            'user_data': LiteralString(_container_quadlet_user_data(containers, content, merged_cloud_init, policies)),
                             'meta_data': LiteralString(_meta_data(name))
                         }
                     }
@@ -135,43 +176,154 @@ def to_application(container_def: dict, runtime_def: dict) -> dict:
             ]
         }
     }
-    # Attach the rendered user_data separately for pretty YAML block emission later
-    app['__rendered_user_data__'] = _container_quadlet_user_data(containers, content, merged_cloud_init, policies)
     return app
 
 
+# Static cloud-init runcmd sections, selected by the runtime policy flags
+_SETUP_PRELUDE_PODMAN = '  - systemctl enable podman.socket\n'
+_SETUP_PRELUDE_TIMER = '  - systemctl enable --now podman-auto-update.timer\n'
+_SETUP_DIRS = (
+    '  - mkdir -p /etc/containers/systemd\n'
+    '  - mkdir -p /var/edge/www\n'
+)
+_QGA_BLOCK = (
+    '  - transactional-update --non-interactive pkg install qemu-guest-agent || true\n'
+    '  - mkdir -p /etc/systemd/system\n'
+    '  - |\n'
+    "    cat <<'EOF' > /etc/systemd/system/enable-qemu-guest-agent.service\n"
+    '    [Unit]\n'
+    '    Description=Enable qemu-guest-agent post-reboot\n'
+    '    After=multi-user.target\n'
+    '\n'
+    '    [Service]\n'
+    '    Type=oneshot\n'
+    '    ExecStart=/usr/bin/systemctl enable --now qemu-guest-agent.service\n'
+    '    RemainAfterExit=yes\n'
+    '\n'
+    '    [Install]\n'
+    '    WantedBy=multi-user.target\n'
+    '    EOF\n'
+    '  - systemctl enable enable-qemu-guest-agent.service || true\n'
+)
+# Match nginx-deployment: create override dir/file
+_QGA_OVERRIDE = (
+    '  - mkdir -p /etc/systemd/system/qemu-guest-agent.service.d\n'
+    '  - |\n'
+    "    cat <<'EOF' > /etc/systemd/system/qemu-guest-agent.service.d/override.conf\n"
+    '    [Unit]\n'
+    '    Requires=\n'
+    '    After=\n'
+    '    EOF\n'
+)
+_REBOOT = '  - reboot\n'
+
+# Quadlet unit written for each container; body holds the PublishPort/Volume/Environment lines
+_CONTAINER_TMPL = (
+    "  - |\n"
+    "    cat <<'EOF' > {unit_path}\n"
+    "    [Container]\n"
+    "    Image={image}\n"
+    "{body}"
+    "{label}"
+    "\n"
+    "    [Install]\n"
+    "    WantedBy=multi-user.target\n"
+    "    EOF\n"
+)
+
+
+def _policy_key(policies) -> tuple:
+    """Normalise the runtime policies into a hashable tuple of flags (all default on)."""
+    pol = policies or {}
+    return (
+        bool(pol.get('enablePodmanSocket', True)),
+        bool(pol.get('enableAutoUpdateTimer', True)),
+        bool(pol.get('setupQemuGuestAgent', True)),
+        bool(pol.get('rebootAfterQga', True)),
+        bool(pol.get('autoUpdateLabel', True)),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _policy_sections(pol_key: tuple):
+    """Pre-join the static user_data sections for a policy combination.
+
+    Returns (prelude, container_label, epilogue). Every container file in a repo
+    normally shares one runtime.yaml, so this is built once per process.
+    """
+    enable_podman_socket, enable_auto_update_timer, setup_qga, reboot_after_qga, auto_update_label = pol_key
+    prelude = (
+        (_SETUP_PRELUDE_PODMAN if enable_podman_socket else '')
+        + (_SETUP_PRELUDE_TIMER if enable_auto_update_timer else '')
+        + _SETUP_DIRS
+    )
+    label = '    Label=io.containers.autoupdate=registry\n' if auto_update_label else ''
+    epilogue = ''
+    if setup_qga:
+        epilogue = _QGA_BLOCK + _QGA_OVERRIDE + (_REBOOT if reboot_after_qga else '')
+    return prelude, label, epilogue
+
+
+def _indent_block(text: str, prefix: str = '    ') -> str:
+    """Prefix every line of text (blank ones included) and end with a newline."""
+    if not text:
+        return ''
+    block = textwrap.indent(text, prefix, lambda _: True)
+    return block if block.endswith('\n') else block + '\n'
+
+
+def _scalar(value, flow: bool = False) -> str:
+    """value as written: plain when it reads back unchanged, double-quoted otherwise.
+
+    flow checks it as an item of an inline [a, b] list, where ',' and brackets also matter.
+    """
+    return _quote_if_needed(str(value), flow)
+
+
+@functools.lru_cache(maxsize=None)
+def _quote_if_needed(text: str, flow: bool) -> str:
+    if '\n' not in text:
+        doc, expected = (f'k: [{text}]', {'k': [text]}) if flow else (f'k: {text}', {'k': text})
+        try:
+            if yaml.load(doc, Loader=_Loader) == expected:
+                return text
+        except yaml.YAMLError:
+            pass
+    return json.dumps(text, ensure_ascii=False)
+
+
 def _container_quadlet_user_data(containers: list, content: list, cloud_init=None, policies=None) -> str:
-    lines = [
-        '#cloud-config',
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w('#cloud-config\n')
 
     # Optional cloud-init basics (users, ssh)
     ci = cloud_init or {}
     ssh = ci.get('ssh') or {}
     if 'passwordAuth' in ssh:
-        lines.append(f"ssh_pwauth: {'true' if ssh.get('passwordAuth') else 'false'}")
+        w(f"ssh_pwauth: {'true' if ssh.get('passwordAuth') else 'false'}\n")
     if 'disableRoot' in ssh:
-        lines.append(f"disable_root: {'true' if ssh.get('disableRoot') else 'false'}")
+        w(f"disable_root: {'true' if ssh.get('disableRoot') else 'false'}\n")
 
     # Support users either in cloudInit.users or top-level spec.users for convenience
     users = (ci.get('users') if isinstance(ci.get('users'), list) else [])
     if users:
-        lines.append('users:')
+        w('users:\n')
         for u in users:
-            lines.append(f"  - name: {u.get('name')}")
+            w(f"  - name: {_scalar(u.get('name'))}\n")
             if u.get('groups'):
                 # render list inline
-                groups = ", ".join([str(g) for g in u.get('groups')])
-                lines.append(f"    groups: [{groups}]")
+                groups = ", ".join([_scalar(g, flow=True) for g in u.get('groups')])
+                w(f"    groups: [{groups}]\n")
             if u.get('sudo'):
-                lines.append(f"    sudo: {u.get('sudo')}")
+                w(f"    sudo: {_scalar(u.get('sudo'))}\n")
             if u.get('shell'):
-                lines.append(f"    shell: {u.get('shell')}")
+                w(f"    shell: {_scalar(u.get('shell'))}\n")
             aks = u.get('sshAuthorizedKeys') or []
             if aks:
-                lines.append('    ssh-authorized-keys:')
+                w('    ssh-authorized-keys:\n')
                 for key in aks:
-                    lines.append(f"      - {key}")
+                    w('      - '); w(_scalar(key)); w('\n')
 
     # Also read top-level users from the container def (legacy convenience)
     # This function receives only the merged cloudInit dict; top-level users/chpasswd
@@ -180,107 +332,56 @@ def _container_quadlet_user_data(containers: list, content: list, cloud_init=Non
     # chpasswd support
     chpwd = ci.get('chpasswd')
     if isinstance(chpwd, dict):
-        lines.append('chpasswd:')
+        w('chpasswd:\n')
         if 'list' in chpwd:
-            lines.append('  list: |')
-            for ln in str(chpwd.get('list')).splitlines():
-                lines.append(f"    {ln}")
+            w('  list: |\n')
+            w(_indent_block(str(chpwd.get('list'))))
         if 'expire' in chpwd:
-            lines.append(f"  expire: {'true' if chpwd.get('expire') else 'false'}")
+            w(f"  expire: {'true' if chpwd.get('expire') else 'false'}\n")
 
     # Files and commands
-    lines += [
-        'write_files: []',
-        'runcmd:',
-    ]
+    w('write_files: []\n')
+    w('runcmd:\n')
 
     # Base system prep (policy-controlled)
-    pol = policies or {}
-    enable_podman_socket = pol.get('enablePodmanSocket', True)
-    enable_auto_update_timer = pol.get('enableAutoUpdateTimer', True)
-    setup_qga = pol.get('setupQemuGuestAgent', True)
-    reboot_after_qga = pol.get('rebootAfterQga', True)
-    auto_update_label = pol.get('autoUpdateLabel', True)
-
-    if enable_podman_socket:
-        lines.append('  - systemctl enable podman.socket')
-    if enable_auto_update_timer:
-        lines.append('  - systemctl enable --now podman-auto-update.timer')
-    lines.append('  - mkdir -p /etc/containers/systemd')
-    lines.append('  - mkdir -p /var/edge/www')
+    prelude, label, epilogue = _policy_sections(_policy_key(policies))
+    w(prelude)
 
     for item in content or []:
         path = item.get('path')
         mode = item.get('mode', '0644')
         data = item.get('data', '')
-        lines.append('  - |')
-        lines.append(f"    cat <<'EOF' > {path}")
-        lines.extend([f"    {ln}" for ln in data.splitlines()])
-        lines.append('    EOF')
-        lines.append(f"    chmod {mode} {path}")
+        w('  - |\n')
+        w(f"    cat <<'EOF' > {path}\n")
+        w(_indent_block(data))
+        w('    EOF\n')
+        w(f"    chmod {mode} {path}\n")
 
     for c in containers or []:
         name = c.get('name', 'app')
-        image = c.get('image')
-        ports = c.get('ports', [])
-        mounts = c.get('mounts', [])
-        env = c.get('env', [])
-        unit_path = f"/etc/containers/systemd/{name}.container"
-        lines.append('  - |')
-        lines.append(f"    cat <<'EOF' > {unit_path}")
-        lines.append('    [Container]')
-        lines.append(f"    Image={image}")
-        for p in ports:
-            lines.append(f"    PublishPort={p}")
-        for m in mounts:
-            hp = m.get('hostPath')
-            mp = m.get('mountPath')
-            sel = ':Z' if m.get('selinuxRelabel') else ''
-            lines.append(f"    Volume={hp}:{mp}{sel}")
-        for e in env:
-            lines.append(f"    Environment={e.get('name')}={e.get('value')}")
-        if auto_update_label:
-            lines.append('    Label=io.containers.autoupdate=registry')
-        lines.append('')
-        lines.append('    [Install]')
-        lines.append('    WantedBy=multi-user.target')
-        lines.append('    EOF')
-
-    lines.append('  - systemctl daemon-reload')
+        body = (
+            "".join(f"    PublishPort={p}\n" for p in c.get('ports', []))
+            + "".join(
+                f"    Volume={m.get('hostPath')}:{m.get('mountPath')}{':Z' if m.get('selinuxRelabel') else ''}\n"
+                for m in c.get('mounts', [])
+            )
+            + "".join(f"    Environment={e.get('name')}={e.get('value')}\n" for e in c.get('env', []))
+        )
+        w(_CONTAINER_TMPL.format_map({
+            'unit_path': f"/etc/containers/systemd/{name}.container",
+            'image': c.get('image'),
+            'body': body,
+            'label': label,
+        }))
+
+    w('  - systemctl daemon-reload\n')
     for c in containers or []:
-        lines.append(f"  - systemctl restart {c.get('name','app')}.service")
+        w('  - systemctl restart '); w(str(c.get('name', 'app'))); w('.service\n')
 
     # Optional: install qemu-guest-agent transactionally and enable next boot
-    if setup_qga:
-        lines.append('  - transactional-update --non-interactive pkg install qemu-guest-agent || true')
-        lines.append('  - mkdir -p /etc/systemd/system')
-        lines.append('  - |')
-        lines.append("    cat <<'EOF' > /etc/systemd/system/enable-qemu-guest-agent.service")
-        lines.append('    [Unit]')
-        lines.append('    Description=Enable qemu-guest-agent post-reboot')
-        lines.append('    After=multi-user.target')
-        lines.append('')
-        lines.append('    [Service]')
-        lines.append('    Type=oneshot')
-        lines.append('    ExecStart=/usr/bin/systemctl enable --now qemu-guest-agent.service')
-        lines.append('    RemainAfterExit=yes')
-        lines.append('')
-        lines.append('    [Install]')
-        lines.append('    WantedBy=multi-user.target')
-        lines.append('    EOF')
-        lines.append('  - systemctl enable enable-qemu-guest-agent.service || true')
-        # Match nginx-deployment: create override dir/file
-        lines.append('  - mkdir -p /etc/systemd/system/qemu-guest-agent.service.d')
-        lines.append('  - |')
-        lines.append("    cat <<'EOF' > /etc/systemd/system/qemu-guest-agent.service.d/override.conf")
-        lines.append('    [Unit]')
-        lines.append('    Requires=')
-        lines.append('    After=')
-        lines.append('    EOF')
-        if reboot_after_qga:
-            lines.append('  - reboot')
-
-    return "\n".join(lines) + "\n"
+    w(epilogue)
+
+    return buf.getvalue()
 
 
 def _meta_data(name: str) -> str:
@@ -288,23 +389,88 @@ def _meta_data(name: str) -> str:
     return f"dsmode: local\nlocal-hostname: \"{hostname}\"\n"
 
 
+@functools.lru_cache(maxsize=None)
+def _script_source() -> bytes:
+    return Path(__file__).read_bytes()
+
+
+def _input_digest(cfile: str, rfile=None) -> str:
+    """Fingerprint of everything a compiled manifest depends on: its inputs and this script."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in (cfile, rfile):
+        h.update(Path(path).read_bytes() if path else b'')
+        h.update(b'\0')
+    h.update(_script_source())
+    return h.hexdigest()
+
+
+def _compile_one(cfile: str, compile_output_dir: Path, rfile=None, shared_runtime_def=None, force: bool = False):
+    """Compile one container definition into an Application manifest.
+
+    rfile is the runtime configuration this container uses (None when there is none);
+    shared_runtime_def is its parsed content when it is the generic runtime.yaml.
+    Returns (name, out_path, compiled); compiled is False when the output's stamp
+    shows the inputs are unchanged since the last run.
+    """
+    # Extract name from filename, removing .container if present
+    stem = Path(cfile).stem
+    name = stem.replace('.container', '')
+    out_path = compile_output_dir / f'{name}.yaml'
+    stamp_path = compile_output_dir / f'{name}.yaml.stamp'
+    digest = _input_digest(cfile, rfile)
+    if not force and out_path.exists() and stamp_path.exists() and stamp_path.read_text().strip() == digest:
+        return name, out_path, False
+
+    container_def = load_yaml(cfile)
+    if shared_runtime_def is not None:
+        runtime_def = shared_runtime_def
+    elif rfile:
+        runtime_def = _load_yaml_cached(rfile, os.stat(rfile).st_mtime_ns)
+    else:
+        runtime_def = {}
+    app = to_application(container_def, runtime_def)
+
+    # user_data/meta_data are LiteralString values, so the dumper emits them as | blocks
+    DumperClass = LiteralSafeDumper if 'LiteralSafeDumper' in globals() and LiteralSafeDumper else None
+    with open(out_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        yaml.dump(app, f, Dumper=DumperClass or _BaseSafeDumper, **_DUMP_OPTIONS)
+    stamp_path.write_text(digest + '\n')
+    return name, out_path, True
+
+
 def main():
+    if _literal_setup_error is not None:
+        print(f"⚠️  YAML literal block setup failed: {_literal_setup_error}")
+    # Debug: print YAML version info
+    print(f"🔧 Using PyYAML version: {yaml.__version__}")
+    print(f"🔧 LiteralSafeDumper available: {LiteralSafeDumper is not None}")
+
     compile_output_dir = Path(os.getenv('COMPILE_OUTPUT_DIR', 'manifests/_compiled'))
+    force = os.getenv('COMPILE_FORCE', '').lower() in ('1', 'true', 'yes')
     ensure_dir(compile_output_dir)
 
-    # Find container definition files by extension first
-    container_files = glob.glob('manifests/containers/*.container.yaml')
-    
+    # Find container definition files by extension first, in one directory pass
+    container_files = []
+    other_yaml_files = []
+    for entry in _scan_dir(CONTAINERS_DIR):
+        if entry.name.endswith('.container.yaml'):
+            container_files.append(entry.path)
+        elif entry.name.endswith('.yaml'):
+            other_yaml_files.append(entry.path)
+
     # Also find any YAML files that contain ContainerDefinition type
-    all_yaml_files = glob.glob('manifests/containers/*.yaml')
-    for yaml_file in all_yaml_files:
+    for yaml_file in other_yaml_files:
         try:
-            with open(yaml_file, 'r') as f:
-                content = yaml.safe_load(f)
-                if content and content.get('type') == 'ContainerDefinition':
-                    if yaml_file not in container_files:
-                        container_files.append(yaml_file)
-                        print(f"🔍 Found ContainerDefinition in {yaml_file}")
+            with open(yaml_file, 'rb') as f:
+                raw = f.read()
+            # Files that never mention the type cannot declare it; only parse the rest to confirm
+            if b'ContainerDefinition' not in raw:
+                continue
+            content = yaml.load(raw, Loader=_Loader)
+            if content and content.get('type') == 'ContainerDefinition':
+                if yaml_file not in container_files:
+                    container_files.append(yaml_file)
+                    print(f"🔍 Found ContainerDefinition in {yaml_file}")
         except Exception:
             continue  # Skip files that can't be parsed
     
@@ -312,56 +478,42 @@ def main():
         print('ℹ️  No container definitions found to compile')
         return 0
 
+    # Prefer a generic runtime.yaml (parsed once here), fallback to per-app runtime files
+    runtime_names = {entry.name for entry in _scan_dir(RUNTIME_CONFIG_DIR)}
+    shared_runtime_def = None
+    if 'runtime.yaml' in runtime_names:
+        generic_runtime = f'{RUNTIME_CONFIG_DIR}/runtime.yaml'
+        shared_runtime_def = _load_yaml_cached(generic_runtime, os.stat(generic_runtime).st_mtime_ns) or {}
+        runtime_files = [generic_runtime] * len(container_files)
+    else:
+        runtime_files = []
+        for cfile in container_files:
+            runtime_name = f"{Path(cfile).stem.replace('.container', '')}.runtime.yaml"
+            runtime_files.append(f'{RUNTIME_CONFIG_DIR}/{runtime_name}' if runtime_name in runtime_names else None)
+
+    # Each container definition compiles independently; fan out across processes once there are enough
+    args = (container_files, repeat(compile_output_dir), runtime_files, repeat(shared_runtime_def), repeat(force))
+    workers = min(os.cpu_count() or 1, len(container_files))
+    if workers > 1 and len(container_files) >= PARALLEL_COMPILE_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_compile_one, *args))
+    else:
+        results = list(map(_compile_one, *args))
+
     compiled = 0
-    for cfile in container_files:
-        # Extract name from filename, removing .container if present
-        stem = Path(cfile).stem
-        name = stem.replace('.container', '')
-        # Prefer a generic runtime.yaml, fallback to per-app runtime file
-        generic_runtime = 'manifests/containers/runtime_configuration/runtime.yaml'
-        per_app_runtime = f'manifests/containers/runtime_configuration/{name}.runtime.yaml'
-        rfile = generic_runtime if os.path.exists(generic_runtime) else per_app_runtime
-        container_def = load_yaml(cfile)
-        runtime_def = load_yaml(rfile) if os.path.exists(rfile) else {}
-        app = to_application(container_def, runtime_def)
-        
-        # Extract user_data and remove helper key before dumping
-        user_data_text = app.pop('__rendered_user_data__', None)
-        
-        out_path = compile_output_dir / f'{name}.yaml'
-        # Dump to string first so we can replace user_data with a literal block
-        DumperClass = LiteralSafeDumper if 'LiteralSafeDumper' in globals() and LiteralSafeDumper else None
-        dumped = yaml.dump(app, Dumper=DumperClass, sort_keys=False) if DumperClass else yaml.safe_dump(app, sort_keys=False)
-
-        if user_data_text:
-            # Replace placeholder line with a YAML literal block using the same indentation
-            import re
-            def replace_block(match):
-                indent = match.group(1)
-                block = indent + "user_data: |\n"
-                for line in user_data_text.splitlines():
-                    block += indent + "  " + line + "\n"
-                return block
-            # Try the regex replacement first
-            dumped = re.sub(r"^(\s*)user_data: .*__USER_DATA_PLACEHOLDER__.*$", replace_block, dumped, flags=re.M)
-            
-            # If that didn't work (placeholder not found), try to find and replace any quoted user_data
-            if "__USER_DATA_PLACEHOLDER__" not in dumped:
-                # Look for user_data: "..." and replace with literal block
-                def replace_quoted_block(match):
-                    indent = match.group(1)
-                    block = indent + "user_data: |\n"
-                    for line in user_data_text.splitlines():
-                        block += indent + "  " + line + "\n"
-                    return block
-                dumped = re.sub(r"^(\s*)user_data: \".*\"$", replace_quoted_block, dumped, flags=re.M | re.DOTALL)
-
-        with open(out_path, 'w') as f:
-            f.write(dumped)
-        print(f"🧩 Compiled {name} → {out_path}")
-        compiled += 1
-
-    print(f"📦 Compiled {compiled} manifest(s)")
+    skipped = 0
+    for name, out_path, was_compiled in results:
+        if was_compiled:
+            print(f"🧩 Compiled {name} → {out_path}")
+            compiled += 1
+        else:
+            print(f"⏭️  {name} is up to date → {out_path}")
+            skipped += 1
+
+    if skipped:
+        print(f"📦 Compiled {compiled} manifest(s), {skipped} unchanged")
+    else:
+        print(f"📦 Compiled {compiled} manifest(s)")
     return 0
 
 
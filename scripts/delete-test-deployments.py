@@ -7,6 +7,10 @@ import os
 import sys
 import requests
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+DELETE_CONCURRENCY = 8
 
 def delete_test_items():
     """Delete test deployments and applications"""
@@ -23,6 +27,13 @@ def delete_test_items():
         'Content-Type': 'application/json'
     }
     
+    # Pooled session shared by the DELETE workers
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
     # Items to delete
     items_to_delete = [
         {
@@ -44,22 +55,34 @@ def delete_test_items():
     
     print("🗑️  Deleting test deployments and applications...")
     
-    for item in items_to_delete:
+    def _delete(item):
         if item['type'] == 'deployment':
             url = f"{fm_api_url}/deployments/{item['id']}"
         else:
             url = f"{fm_api_url}/deployment-applications/{item['id']}"
         
         print(f"🗑️  Deleting {item['type']}: {item['name']}")
-        
-        response = requests.delete(url, headers=headers)
-        
-        if response.status_code == 204:
-            print(f"✅ Deleted {item['type']}: {item['name']}")
-        else:
-            print(f"❌ Failed to delete {item['type']} {item['name']}: {response.status_code}")
-            if response.text:
-                print(f"   Response: {response.text}")
+        return session.delete(url, timeout=10)
+    
+    with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as executor:
+        # Delete deployments first (they depend on applications), then the applications
+        for kind in ('deployment', 'application'):
+            futures = {executor.submit(_delete, item): item
+                       for item in items_to_delete if item['type'] == kind}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    response = future.result()
+                except requests.RequestException as e:
+                    print(f"❌ Failed to delete {item['type']} {item['name']}: {e}")
+                    continue
+                
+                if response.status_code == 204:
+                    print(f"✅ Deleted {item['type']}: {item['name']}")
+                else:
+                    print(f"❌ Failed to delete {item['type']} {item['name']}: {response.status_code}")
+                    if response.text:
+                        print(f"   Response: {response.text}")
     
     print("\n🎯 Cleanup complete!")
 
@@ -7,14 +7,14 @@ by creating separate applications for testing.
 import os
 import sys
 import yaml
-import json
-import requests
-import glob
-from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any
+
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
 # Import the main deployment class
 sys.path.append(os.path.dirname(__file__))
+import deploy
 from deploy import FleetManagerGitOps
 
 class TestModeDeployer(FleetManagerGitOps):
@@ -22,32 +22,38 @@ class TestModeDeployer(FleetManagerGitOps):
         super().__init__()
         self.test_mode = test_mode
         self.test_cluster_group = test_cluster_group
+        # Parsed test manifests keyed by path, so they are not re-read from disk
+        self._parsed: Dict[str, Dict[str, Any]] = {}
         
     def modify_manifest_for_test(self, manifest_path: str) -> str:
-        """Create a test version of the manifest with modified cluster groups and app name"""
+        """Create a test version of the manifest with modified cluster groups and app name
+
+        The test manifest is kept in memory (self._parsed) under the returned
+        '-test.yaml' path; nothing is written to disk.
+        """
         with open(manifest_path, 'r') as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_Loader)
         
-        # Create a copy for modification
-        test_manifest = manifest.copy()
+        # Rebuild metadata rather than mutating it in place so the original dict is untouched
+        test_manifest = dict(manifest)
         
         # Modify metadata for testing
         if 'metadata' in test_manifest:
+            metadata = dict(test_manifest['metadata'] or {})
             # Change cluster groups to test cluster group
-            test_manifest['metadata']['clusterGroups'] = [self.test_cluster_group]
+            metadata['clusterGroups'] = [self.test_cluster_group]
             
             # Add test suffix to application name
-            original_name = test_manifest['metadata'].get('name', '')
-            test_manifest['metadata']['name'] = f"{original_name}-test"
+            original_name = metadata.get('name', '')
+            metadata['name'] = f"{original_name}-test"
             
             # Add test description
-            original_desc = test_manifest['metadata'].get('description', '')
-            test_manifest['metadata']['description'] = f"[TEST] {original_desc}"
+            original_desc = metadata.get('description', '')
+            metadata['description'] = f"[TEST] {original_desc}"
+            test_manifest['metadata'] = metadata
         
-        # Create test manifest file
         test_manifest_path = manifest_path.replace('.yaml', '-test.yaml')
-        with open(test_manifest_path, 'w') as f:
-            yaml.dump(test_manifest, f, default_flow_style=False)
+        self._parsed[test_manifest_path] = test_manifest
         
         return test_manifest_path
     
@@ -58,15 +64,20 @@ class TestModeDeployer(FleetManagerGitOps):
             
             # Create test version of manifest
             test_manifest_path = self.modify_manifest_for_test(manifest_path)
+            test_manifest = self._parsed[test_manifest_path]
+            test_app_name = self.get_app_name_from_manifest(test_manifest_path)
             
             try:
-                # Deploy test version
+                # Deploy test version straight from memory
                 print(f"📄 Deploying test manifest: {test_manifest_path}")
-                success = self.process_manifest(test_manifest_path)
+                test_manifest_yaml = yaml.dump(test_manifest, Dumper=_Dumper, default_flow_style=False)
+                success = self.process_manifest(
+                    test_manifest_path, manifest=test_manifest, manifest_yaml=test_manifest_yaml
+                )
                 
                 if success:
                     print(f"✅ Test deployment successful!")
-                    print(f"📋 Test application: {self.get_app_name_from_manifest(test_manifest_path)}")
+                    print(f"📋 Test application: {test_app_name}")
                     print(f"🎯 Test cluster group: {self.test_cluster_group}")
                 else:
                     print(f"❌ Test deployment failed!")
@@ -74,20 +85,34 @@ class TestModeDeployer(FleetManagerGitOps):
                 return success
                 
             finally:
-                # Clean up test manifest file
-                if os.path.exists(test_manifest_path):
-                    os.remove(test_manifest_path)
-                    print(f"🧹 Cleaned up test manifest: {test_manifest_path}")
+                self._parsed.pop(test_manifest_path, None)
         else:
             print(f"🚀 PRODUCTION MODE: Deploying original {manifest_path}")
             return self.process_manifest(manifest_path)
     
     def get_app_name_from_manifest(self, manifest_path: str) -> str:
-        """Extract application name from manifest"""
-        with open(manifest_path, 'r') as f:
-            manifest = yaml.safe_load(f)
+        """Extract application name from manifest (in-memory test manifests first)"""
+        manifest = self._parsed.get(manifest_path)
+        if manifest is None:
+            with open(manifest_path, 'r') as f:
+                manifest = yaml.load(f, Loader=_Loader)
         return manifest.get('metadata', {}).get('name', 'unknown')
     
+    def _process_with_test_mode(self, manifest_path: str) -> str:
+        """Deploy one manifest; returns 'success', 'skip' or 'fail' for the summary"""
+        try:
+            print(f"\n📄 Processing: {manifest_path}")
+            
+            if self.should_process_manifest(manifest_path):
+                success = self.deploy_manifest_with_test_mode(manifest_path)
+                return 'success' if success else 'fail'
+            print(f"⏭️  Skipping {manifest_path} (filtered out)")
+            return 'skip'
+                
+        except Exception as e:
+            print(f"❌ Error processing {manifest_path}: {e}")
+            return 'fail'
+    
     def run_with_test_mode(self):
         """Main deployment process with test mode support"""
         print("🚀 Starting Fleet Manager GitOps Deployment")
@@ -100,7 +125,7 @@ class TestModeDeployer(FleetManagerGitOps):
         
         # Test API connection
         try:
-            response = requests.get(f"{self.fm_api_url}/deployments", headers=self.headers, timeout=10)
+            response = self.session.get(f"{self.fm_api_url}/deployments", timeout=10)
             if response.status_code != 200:
                 print("❌ Fleet Manager API connection failed")
                 return False
@@ -119,28 +144,11 @@ class TestModeDeployer(FleetManagerGitOps):
         
         print(f"📋 Found {len(changed_files)} changed manifest files")
         
-        # Process each manifest
-        success_count = 0
-        skip_count = 0
-        fail_count = 0
-        
-        for manifest_path in changed_files:
-            try:
-                print(f"\n📄 Processing: {manifest_path}")
-                
-                if self.should_process_manifest(manifest_path):
-                    success = self.deploy_manifest_with_test_mode(manifest_path)
-                    if success:
-                        success_count += 1
-                    else:
-                        fail_count += 1
-                else:
-                    print(f"⏭️  Skipping {manifest_path} (filtered out)")
-                    skip_count += 1
-                    
-            except Exception as e:
-                print(f"❌ Error processing {manifest_path}: {e}")
-                fail_count += 1
+        # Process manifests concurrently; each is independent and network-bound
+        outcomes = self._map_manifests(self._process_with_test_mode, changed_files)
+        success_count = outcomes.count('success')
+        skip_count = outcomes.count('skip')
+        fail_count = outcomes.count('fail')
         
         # Print summary
         print(f"\n📊 Deployment Summary:")
@@ -167,8 +175,11 @@ def main():
     parser.add_argument('--test', action='store_true', help='Enable test mode')
     parser.add_argument('--test-cluster-group', default='dd_szt15b', help='Test cluster group name')
     parser.add_argument('--target-apps', help='Comma-separated list of target applications')
+    parser.add_argument('--max-parallel', type=int, default=deploy.DEPLOY_PARALLELISM,
+                        help=f'Manifests processed concurrently (default {deploy.DEPLOY_PARALLELISM}, env FM_DEPLOY_PARALLELISM)')
     
     args = parser.parse_args()
+    deploy.DEPLOY_PARALLELISM = max(1, args.max_parallel)
     
     # Set environment variables
     if args.test:
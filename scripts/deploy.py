@@ -4,15 +4,156 @@ GitOps deployment script for Fleet Manager
 Automatically deploys manifests from GitHub to Fleet Manager via direct API calls
 """
 
+import functools
+import hashlib
 import os
 import sys
 import subprocess
 import yaml
 import json
 import requests
-import glob
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib3.util.retry import Retry
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson  # optional C accelerator for request bodies and large list responses
+except ImportError:
+    orjson = None
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _json_body(payload: Any) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib encoder handles
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+def _walk_manifests(root: str):
+    """Yield every visible .yaml/.yml file under root in one scandir pass (symlinked dirs not followed)"""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(('.yaml', '.yml')) and not entry.name.startswith('.'):
+                    yield entry.path
+
+def _canonical_text(text: str) -> str:
+    """YAML text with CRLF/CR line endings unified to LF.
+
+    The YAML parser folds line breaks the same way, so texts equal under this form parse
+    to the same manifest. Trailing newlines are kept: a block scalar at the end of the
+    file gains or loses its final newline with them.
+    """
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+class _ManifestOutput:
+    """Stdout proxy that collects each worker's prints and writes them as one block.
+
+    Threads inside capture() append to their own buffer; everything else passes straight
+    through. Keeps concurrent manifests from interleaving and turns a manifest's dozens of
+    small writes into a single one.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            with self._lock:
+                return self._stream.write(text)
+        buf.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    @contextmanager
+    def capture(self, buf: List[str] = None):
+        """Buffer this thread's output; the outermost capture writes it out on exit"""
+        outer = getattr(self._local, 'buf', None)
+        self._local.buf = buf if buf is not None else (outer if outer is not None else [])
+        try:
+            yield self._local.buf
+        finally:
+            if outer is None and buf is None:
+                with self._lock:
+                    self._stream.write(''.join(self._local.buf))
+                    self._stream.flush()
+            self._local.buf = outer
+
+    def bind(self, fn):
+        """Wrap fn so pool threads running it write into the calling thread's buffer"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            return fn
+        def bound(*args, **kwargs):
+            with self.capture(buf):
+                return fn(*args, **kwargs)
+        return bound
+
+# Items requested per page when walking list endpoints via their 'next' cursor
+PAGE_SIZE = 200
+
+# Parsed manifests and their comparison fingerprints, stored as JSON sidecars keyed by content hash.
+# Bump MANIFEST_CACHE_VERSION whenever _normalize_manifest_structure or _normalize changes.
+# The encoder is part of the key: orjson and json format some values (e.g. floats) differently.
+MANIFEST_CACHE_DIR = Path(os.getenv('FM_MANIFEST_CACHE_DIR', '.cache/manifests'))
+MANIFEST_CACHE_VERSION = b'3:' + (b'orjson' if orjson is not None else b'json')
+
+# Manifest annotations naming the target cluster group(s)
+ANNOTATION_CLUSTER_GROUPS = 'fleet.scalecomputing.com/cluster-groups'
+ANNOTATION_CLUSTER_GROUP = 'fleet.scalecomputing.com/cluster-group'
+
+# Git pathspecs for manifest files; ':(glob)' makes '**/' also match files directly under manifests/
+MANIFEST_PATHSPECS = [':(glob)manifests/**/*.yaml', ':(glob)manifests/**/*.yml']
+
+# Manifests processed concurrently; each one is a handful of sequential API round trips
+DEPLOY_PARALLELISM = max(1, int(os.getenv('FM_DEPLOY_PARALLELISM', '8')))
+
+# Cluster groups rolled out concurrently within one manifest (nested under DEPLOY_PARALLELISM)
+GROUP_PARALLELISM = max(1, int(os.getenv('FM_GROUP_PARALLELISM', '4')))
+
+# Retry gateway errors and 429s; urllib3 never replays the POSTs that create resources
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
 
 class FleetManagerGitOps:
     def __init__(self):
@@ -33,6 +174,17 @@ class FleetManagerGitOps:
         
         # Track deployments for monitoring
         self.created_deployments = []
+
+        # Name -> object indexes of applications/deployments, fetched once per run (see _load_indices)
+        self._app_index: Dict[str, Dict[str, Any]] = None
+        self._deploy_index: Dict[str, Dict[str, Any]] = None
+        self._cluster_groups: Dict[str, str] = None
+
+        # Content digest -> encoded manifest cache entry, so repeat parses in a run skip the disk
+        self._parse_memo: Dict[str, bytes] = {}
+        # ((containers dir, its mtime), ContainerDefinition files, their source/output paths), reused while the directory is untouched
+        self._container_files: Tuple[Tuple[str, int], List[str], List[Tuple[str, str, str]]] = None
+        self._index_lock = threading.RLock()
         
         if not self.fm_api_key:
             raise ValueError("SC_FM_APIKEY environment variable is required")
@@ -46,34 +198,43 @@ class FleetManagerGitOps:
             'user-agent': 'fleet-manager-gitops/2.0'
         }
 
+        # One pooled session for every API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        pool_size = max(16, DEPLOY_PARALLELISM * GROUP_PARALLELISM)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=RETRY_POLICY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def _debug_fail(self, resp: requests.Response, context: str) -> None:
         print(f"❌ {context} (status: {resp.status_code})")
-        try:
-            print(f"Response JSON: {resp.json()}")
-        except Exception:
-            print(f"Response Text: {resp.text[:500]}")
+        # Only attempt a JSON decode when the server says the body is JSON
+        if 'json' in resp.headers.get('content-type', '').lower():
+            try:
+                print(f"Response JSON: {_json(resp)}")
+                return
+            except ValueError:
+                pass
+        print(f"Response Text: {resp.text[:500]}")
+
+    @functools.cached_property
+    def _git_source_parts(self) -> List[str]:
+        """Repository, commit and branch lines for descriptions; looked up once per run"""
+        parts = []
 
-    def _create_gitops_description(self, app_name: str, action: str = "managed") -> str:
-        """Create comprehensive GitOps description for UI visibility"""
-        from datetime import datetime
-        
-        # Base GitOps information
-        description_parts = [
-            "🤖 GitOps Managed Application",
-            f"📦 Application: {app_name}",
-            f"🔄 Action: {action.title()}",
-            f"🕐 Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC"
-        ]
-        
         # Repository information
         try:
             result = subprocess.run(['git', 'remote', 'get-url', 'origin'],
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 repo_url = result.stdout.strip()
-                description_parts.append(f"🔗 Repository: {repo_url}")
+                parts.append(f"🔗 Repository: {repo_url}")
         except (OSError, subprocess.SubprocessError):
-            description_parts.append("🔗 Repository: fleet-manager-gitops")
+            parts.append("🔗 Repository: fleet-manager-gitops")
 
         # Git commit information
         try:
@@ -81,7 +242,7 @@ class FleetManagerGitOps:
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 commit_sha = result.stdout.strip()
-                description_parts.append(f"📝 Commit: {commit_sha}")
+                parts.append(f"📝 Commit: {commit_sha}")
         except (OSError, subprocess.SubprocessError):
             pass
 
@@ -92,9 +253,24 @@ class FleetManagerGitOps:
             if result.returncode == 0:
                 branch = result.stdout.strip()
                 if branch:
-                    description_parts.append(f"🌿 Branch: {branch}")
+                    parts.append(f"🌿 Branch: {branch}")
         except (OSError, subprocess.SubprocessError):
             pass
+
+        return parts
+
+    def _create_gitops_description(self, app_name: str, action: str = "managed") -> str:
+        """Create comprehensive GitOps description for UI visibility"""
+        from datetime import datetime
+        
+        # Base GitOps information
+        description_parts = [
+            "🤖 GitOps Managed Application",
+            f"📦 Application: {app_name}",
+            f"🔄 Action: {action.title()}",
+            f"🕐 Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC",
+            *self._git_source_parts,
+        ]
         
         # Test mode indicator
         if self.test_mode:
@@ -194,9 +370,10 @@ class FleetManagerGitOps:
                 # Delete deployment
                 try:
                     url = f"{self.fm_api_url}/deployments/{dep_id}"
-                    response = requests.delete(url, headers=self.headers)
+                    response = self.session.delete(url)
                     
                     if response.status_code == 204:
+                        self._forget('_deploy_index', deployment_name)
                         print(f"✅ Deleted deployment: {deployment_name}")
                         deployments_deleted += 1
                     else:
@@ -214,9 +391,10 @@ class FleetManagerGitOps:
             print(f"🗑️  Deleting application: {app_name}")
             try:
                 url = f"{self.fm_api_url}/deployment-applications/{app_id}"
-                response = requests.delete(url, headers=self.headers)
+                response = self.session.delete(url)
                 
                 if response.status_code == 204:
+                    self._forget('_app_index', app_name)
                     print(f"✅ Deleted application: {app_name}")
                 else:
                     print(f"❌ Failed to delete application {app_name}: {response.status_code}")
@@ -229,12 +407,72 @@ class FleetManagerGitOps:
         return deployments_deleted > 0
 
     @staticmethod
-    def _normalize(obj: Any) -> str:
-        """Return a stable JSON string for semantic equality checks."""
+    def _normalize(obj: Any) -> bytes:
+        """Return stable JSON bytes for semantic equality checks (orjson when installed)."""
         try:
-            return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+            if orjson is not None:
+                try:
+                    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+                except TypeError:
+                    pass  # e.g. integers wider than 64 bits; fall through to the stdlib encoder
+            return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
         except Exception:
-            return str(obj)
+            return str(obj).encode('utf-8')
+
+    def _parse_yaml_cached(self, text: str) -> Tuple[Any, Optional[str]]:
+        """Parse YAML text, reusing the JSON entry from earlier in this run or a previous run.
+
+        Returns (parsed, fingerprint) where fingerprint is the SHA-256 of the _normalize()
+        bytes of the normalized structure, or None when the content does not survive a
+        JSON round trip (dates, non-string keys, ...) and therefore is not cached.
+        Entries are kept encoded so every hit decodes into fresh objects callers may mutate.
+        """
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(MANIFEST_CACHE_VERSION + b'\0' + data).hexdigest()
+        entry_path = MANIFEST_CACHE_DIR / f"{digest}.json"
+        raw_entry = self._parse_memo.get(digest)
+        if raw_entry is None:
+            try:
+                raw_entry = entry_path.read_bytes()
+            except OSError:
+                pass
+        if raw_entry is not None:
+            try:
+                entry = orjson.loads(raw_entry) if orjson is not None else json.loads(raw_entry)
+                parsed, fingerprint = entry['parsed'], entry['fingerprint']
+                self._parse_memo[digest] = raw_entry
+                return parsed, fingerprint
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        parsed = yaml.load(data, Loader=_Loader)
+        try:
+            clone = json.loads(json.dumps(parsed))
+        except (TypeError, ValueError):
+            return parsed, None
+        if clone != parsed:
+            return parsed, None
+        fingerprint = hashlib.sha256(self._normalize(self._normalize_manifest_structure(clone))).hexdigest()
+
+        entry = {'parsed': parsed, 'fingerprint': fingerprint}
+        if orjson is not None:
+            try:
+                raw_entry = orjson.dumps(entry)
+            except TypeError:
+                # Integers wider than 64 bits: orjson cannot write them and would read them
+                # back as floats, so such manifests are fingerprinted but not cached
+                return parsed, fingerprint
+        else:
+            raw_entry = _json_body(entry)
+        self._parse_memo[digest] = raw_entry
+        try:
+            MANIFEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(raw_entry)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass
+        return parsed, fingerprint
 
     def should_process_manifest(self, file_path: str, app_name: str) -> bool:
         """Determine if a manifest should be processed based on targeting rules"""
@@ -247,36 +485,76 @@ class FleetManagerGitOps:
         
         return True
 
+    @staticmethod
+    def _extract_cluster_groups(manifest: Dict[str, Any]) -> List[str]:
+        """Target cluster group names declared by a manifest, or [] to use the default.
+
+        Sources in priority order: metadata.clusterGroups/clusterGroup, then
+        spec.clusterGroups/clusterGroup, then the cluster-group(s) annotations.
+        """
+        md = manifest.get('metadata', {}) or {}
+        for section in (md, manifest.get('spec', {}) or {}):
+            groups = section.get('clusterGroups')
+            if type(groups) is list:
+                names = [str(x) for x in groups if x]
+                if names:
+                    return names
+            elif section.get('clusterGroup'):
+                return [str(section.get('clusterGroup'))]
+
+        # Annotations support (comma-separated or single)
+        annotations = md.get('annotations')
+        if annotations:
+            ann_multi = annotations.get(ANNOTATION_CLUSTER_GROUPS)
+            if ann_multi:
+                return [x.strip() for x in str(ann_multi).split(',') if x.strip()]
+            ann_single = annotations.get(ANNOTATION_CLUSTER_GROUP)
+            if ann_single:
+                return [str(ann_single)]
+        return []
+
     @staticmethod
     def _normalize_manifest_structure(manifest: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize fields to match API expectations (e.g., labels list)."""
+        """Normalize fields to match API expectations (e.g., labels list).
+
+        Only values that actually need normalizing are written back, so an already
+        normalized manifest (list labels, no trailing user_data whitespace) is left untouched.
+        """
         if not isinstance(manifest, dict):
             return manifest
-        md = manifest.get('metadata') or {}
-        if isinstance(md, dict):
+        md = manifest.get('metadata')
+        if type(md) is dict:
             labels = md.get('labels')
             # API expects a list for labels; accept dict in YAML and convert
-            if isinstance(labels, dict):
+            if type(labels) is dict:
                 # Convert to list of key/value objects
                 md['labels'] = [{ 'key': k, 'value': v } for k, v in labels.items()]
-                manifest['metadata'] = md
         # Normalize cloud-init user_data whitespace to reduce false positives
-        spec = manifest.get('spec') or {}
-        if isinstance(spec, dict):
-            resources = spec.get('resources') or []
-            if isinstance(resources, list):
-                for res in resources:
-                    if not isinstance(res, dict):
-                        continue
-                    if (res.get('type') == 'virdomain' and isinstance(res.get('spec'), dict)):
-                        rspec = res['spec']
-                        cid = rspec.get('cloud_init_data')
-                        if isinstance(cid, dict) and isinstance(cid.get('user_data'), str):
-                            cid['user_data'] = cid['user_data'].rstrip()
-                            rspec['cloud_init_data'] = cid
-                            res['spec'] = rspec
+        spec = manifest.get('spec')
+        resources = spec.get('resources') if type(spec) is dict else None
+        if type(resources) is list:
+            for res in resources:
+                if type(res) is not dict or res.get('type') != 'virdomain':
+                    continue
+                rspec = res.get('spec')
+                cid = rspec.get('cloud_init_data') if type(rspec) is dict else None
+                if type(cid) is dict:
+                    user_data = cid.get('user_data')
+                    if type(user_data) is str and user_data[-1:].isspace():
+                        cid['user_data'] = user_data.rstrip()
         return manifest
 
+    @staticmethod
+    def _git_manifest_paths(args: List[str]) -> List[str]:
+        """Run a git listing command restricted to manifest YAML; NUL-separated so any path is safe"""
+        # --no-optional-locks: concurrent listings must not contend for index.lock when refreshing stat info
+        output = subprocess.run(
+            ['git', '--no-optional-locks', *args, '--', *MANIFEST_PATHSPECS],
+            capture_output=True, text=True, check=True
+        ).stdout
+        # Every -z record ends in NUL, so the last split element is always the empty tail
+        return output.split('\0')[:-1]
+
     def get_changed_files(self) -> List[str]:
         """Get list of changed manifest files"""
         changed_files = []
@@ -286,14 +564,17 @@ class FleetManagerGitOps:
         try:
             event_path = os.getenv('GITHUB_EVENT_PATH')
             if event_path and os.path.exists(event_path):
-                with open(event_path, 'r') as f:
-                    event = json.load(f)
-                # Push event: aggregate added/modified files across commits
+                with open(event_path, 'rb') as f:
+                    raw_event = f.read()
+                event = orjson.loads(raw_event) if orjson is not None else json.loads(raw_event)
+                # Push event: replay added/modified/removed across commits in order, so a file
+                # removed by a later commit in the push is not reported as changed
                 if event.get('commits'):
-                    gh_candidates: List[str] = []
+                    gh_candidates: Set[str] = set()
                     for c in event.get('commits') or []:
-                        gh_candidates.extend(c.get('added') or [])
-                        gh_candidates.extend(c.get('modified') or [])
+                        gh_candidates.update(c.get('added') or [])
+                        gh_candidates.update(c.get('modified') or [])
+                        gh_candidates.difference_update(c.get('removed') or [])
                     changed_files = [
                         f for f in gh_candidates if f and 
                         f.startswith('manifests/') and 
@@ -325,66 +606,41 @@ class FleetManagerGitOps:
                 ['git', 'rev-parse', '--verify', 'HEAD'], capture_output=True, text=True
             ).returncode == 0
 
-            diff_last_commits = []
-            diff_index_vs_head = []
-            diff_worktree_vs_head = []
-            untracked = []
-
             if in_repo and has_head:
-                # 1) Changes between last two commits (CI typical)
-                diff_last_commits = subprocess.run(
-                    ['git', 'diff', '--name-only', 'HEAD~1', 'HEAD'],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip().split('\n')
-
-                # 2) Staged changes vs HEAD (local dev)
-                diff_index_vs_head = subprocess.run(
-                    ['git', 'diff', '--cached', '--name-only', 'HEAD'],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip().split('\n')
-
-                # 3) Unstaged working tree changes vs HEAD (local dev)
-                diff_worktree_vs_head = subprocess.run(
-                    ['git', 'diff', '--name-only', 'HEAD'],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip().split('\n')
-
-                # 4) Untracked files (e.g., freshly compiled outputs not yet added)
-                untracked = subprocess.run(
-                    ['git', 'ls-files', '--others', '--exclude-standard'],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip().split('\n')
-
-            candidates = [
-                *diff_last_commits,
-                *diff_index_vs_head,
-                *diff_worktree_vs_head,
-                *untracked,
-            ]
-
-            changed_files = [
-                f for f in candidates if f and 
-                f.startswith('manifests/') and 
-                f.endswith(('.yaml', '.yml'))
-            ]
+                listings = [
+                    # 1) Changes between last two commits (CI typical)
+                    ['diff', '-z', '--name-only', '--diff-filter=d', 'HEAD~1', 'HEAD'],
+                    # 2) Staged changes vs HEAD (local dev)
+                    ['diff', '-z', '--cached', '--name-only', '--diff-filter=d', 'HEAD'],
+                    # 3) Unstaged working tree changes vs HEAD (local dev)
+                    ['diff', '-z', '--name-only', '--diff-filter=d', 'HEAD'],
+                    # 4) Untracked files (e.g., freshly compiled outputs not yet added)
+                    ['ls-files', '-z', '--others', '--exclude-standard'],
+                ]
+                # The listings are independent read-only queries; run them concurrently.
+                # map() re-raises the first failure, which discards all results as before.
+                with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+                    results = list(executor.map(self._git_manifest_paths, listings))
+
+                # git already restricted these to manifest YAML via MANIFEST_PATHSPECS
+                changed_files = set().union(*results)
         except Exception:
             # If git is unavailable or repo has no history, process all manifests
             pass
 
         # If still nothing, only scan all manifests if explicitly requested
         if not changed_files and process_all:
-            changed_files = (
-                glob.glob('manifests/**/*.yaml', recursive=True) +
-                glob.glob('manifests/**/*.yml', recursive=True)
-            )
+            changed_files = list(_walk_manifests('manifests'))
         
         return sorted(set(changed_files))
 
-    def load_manifest(self, file_path: str) -> Dict[str, Any]:
-        """Load and parse a YAML manifest file"""
+    def load_manifest(self, file_path: str, text: str = None) -> Dict[str, Any]:
+        """Load and parse a YAML manifest file, or its already-read text"""
         try:
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
+            if text is None:
+                with open(file_path, 'r') as f:
+                    text = f.read()
+            return self._parse_yaml_cached(text)[0]
         except Exception as e:
             print(f"❌ Error loading {file_path}: {e}")
             return None
@@ -403,25 +659,50 @@ class FleetManagerGitOps:
         app = self.get_deployment_application(app_name)
         return app.get('id') if app else None
 
+    def _list_all(self, path: str) -> List[Dict[str, Any]]:
+        """Return every item of a list endpoint, following its 'next' cursor"""
+        items: List[Dict[str, Any]] = []
+        url = f"{self.fm_api_url}/{path}?limit={PAGE_SIZE}"
+        while url:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            data = _json(response)
+            items.extend(data.get('items', []))
+            url = data.get('next')
+        return items
+
+    def _load_indices(self) -> None:
+        """Fetch the application and deployment listings once and index them by name.
+
+        Every manifest in a run looks up its application and deployments by name, so
+        one listing each replaces a full paginated scan per lookup. Writes made during
+        the run keep the indexes current via _remember / _forget.
+        """
+        with self._index_lock:
+            if self._app_index is None:
+                self._app_index = {a.get('name'): a for a in self._list_all('deployment-applications')}
+            if self._deploy_index is None:
+                self._deploy_index = {d.get('name'): d for d in self._list_all('deployments')}
+
+    def _remember(self, index_attr: str, obj: Dict[str, Any]) -> None:
+        """Merge a created/updated object into an already-loaded index"""
+        with self._index_lock:
+            index = getattr(self, index_attr)
+            if index is not None:
+                name = obj.get('name')
+                index[name] = {**index.get(name, {}), **obj}
+
+    def _forget(self, index_attr: str, name: str) -> None:
+        with self._index_lock:
+            index = getattr(self, index_attr)
+            if index is not None:
+                index.pop(name, None)
+
     def get_deployment_application(self, app_name: str) -> Dict[str, Any]:
         """Return full deployment application object by name (or None)"""
         try:
-            # Handle pagination to get all applications
-            url = f"{self.fm_api_url}/deployment-applications?limit=50"
-            
-            while url:
-                response = requests.get(url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                
-                for app in data.get('items', []):
-                    if app.get('name') == app_name:
-                        return app
-                
-                # Check for next page
-                url = data.get('next')
-            
-            return None
+            self._load_indices()
+            return self._app_index.get(app_name)
         except Exception as e:
             print(f"❌ Error getting application {app_name}: {e}")
             return None
@@ -440,10 +721,9 @@ class FleetManagerGitOps:
             }
             
             # Create without UUID uses POST; PUT with UUID is for updates
-            response = requests.post(
+            response = self.session.post(
                 f"{self.fm_api_url}/deployment-applications",
-                headers=self.headers,
-                json=payload,
+                data=_json_body(payload),
                 timeout=30
             )
             if response.status_code >= 400:
@@ -452,6 +732,7 @@ class FleetManagerGitOps:
             
             data = response.json()
             app_id = data.get('id')
+            self._remember('_app_index', {**payload, **data, 'id': app_id})
             print(f"✅ Created new application: {app_name} (ID: {app_id})")
             return app_id
             
@@ -472,16 +753,16 @@ class FleetManagerGitOps:
                 "description": gitops_description
             }
             
-            response = requests.put(
+            response = self.session.put(
                 f"{self.fm_api_url}/deployment-applications/{app_id}",
-                headers=self.headers,
-                json=payload,
+                data=_json_body(payload),
                 timeout=30
             )
             if response.status_code >= 400:
                 self._debug_fail(response, f"Update application PUT /deployment-applications/{app_id}")
                 response.raise_for_status()
             
+            self._remember('_app_index', {**payload, 'id': app_id})
             print(f"✅ Updated application: {app_name} (ID: {app_id})")
             return True
             
@@ -490,21 +771,18 @@ class FleetManagerGitOps:
             return False
 
     def list_cluster_groups(self) -> Dict[str, str]:
-        """Return a mapping of cluster group name -> id"""
+        """Return a mapping of cluster group name -> id (fetched once per run)"""
         try:
-            response = requests.get(
-                f"{self.fm_api_url}/cluster-groups?limit=200",
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            name_to_id = {}
-            for group in response.json().get('items', []):
-                name = group.get('name')
-                gid = group.get('id')
-                if name and gid:
-                    name_to_id[name] = gid
-            return name_to_id
+            with self._index_lock:
+                if self._cluster_groups is None:
+                    name_to_id = {}
+                    for group in self._list_all('cluster-groups'):
+                        name = group.get('name')
+                        gid = group.get('id')
+                        if name and gid:
+                            name_to_id[name] = gid
+                    self._cluster_groups = name_to_id
+                return self._cluster_groups
         except Exception as e:
             print(f"❌ Error listing cluster groups: {e}")
             return {}
@@ -512,22 +790,9 @@ class FleetManagerGitOps:
     def find_deployment(self, name: str) -> str:
         """Find an existing deployment id by name"""
         try:
-            # Handle pagination to get all deployments
-            url = f"{self.fm_api_url}/deployments?limit=50"
-            
-            while url:
-                response = requests.get(url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                
-                for dep in data.get('items', []):
-                    if dep.get('name') == name:
-                        return dep.get('id')
-                
-                # Check for next page
-                url = data.get('next')
-            
-            return None
+            self._load_indices()
+            dep = self._deploy_index.get(name)
+            return dep.get('id') if dep else None
         except Exception as e:
             print(f"❌ Error finding deployment {name}: {e}")
             return None
@@ -550,16 +815,16 @@ class FleetManagerGitOps:
                     }
                 ]
             }
-            response = requests.post(
+            response = self.session.post(
                 f"{self.fm_api_url}/deployments",
-                headers=self.headers,
-                json=payload,
+                data=_json_body(payload),
                 timeout=30
             )
             if response.status_code >= 400:
                 self._debug_fail(response, "Create deployment POST /deployments")
                 response.raise_for_status()
             dep_id = response.json().get('id')
+            self._remember('_deploy_index', {**payload, 'id': dep_id})
             print(f"✅ Created deployment: {name} (ID: {dep_id})")
             return dep_id
         except Exception as e:
@@ -582,10 +847,9 @@ class FleetManagerGitOps:
                     }
                 ]
             }
-            response = requests.put(
+            response = self.session.put(
                 f"{self.fm_api_url}/deployments/{dep_id}",
-                headers=self.headers,
-                json=payload,
+                data=_json_body(payload),
                 timeout=30
             )
             if response.status_code >= 400:
@@ -600,9 +864,8 @@ class FleetManagerGitOps:
     def get_deployment_status(self, dep_id: str) -> Dict[str, Any]:
         """Get detailed deployment status and information"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.fm_api_url}/deployments/{dep_id}",
-                headers=self.headers,
                 timeout=30
             )
             if response.status_code == 200:
@@ -618,33 +881,23 @@ class FleetManagerGitOps:
         """Check for potential deployment conflicts"""
         conflicts = []
         try:
-            # Get all deployments
-            response = requests.get(
-                f"{self.fm_api_url}/deployments?limit=200",
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            deployments = response.json().get('items', [])
+            self._load_indices()
             
-            # Check for naming conflicts
-            for deployment in deployments:
-                dep_name = deployment.get('name')
-                dep_app_id = deployment.get('applicationId')
+            # Check for naming conflicts: one index lookup per expected deployment name
+            for group_name in cluster_groups:
+                expected_name = f"{app_name}-{group_name}"
+                deployment = self._deploy_index.get(expected_name)
+                if deployment is None:
+                    continue
                 dep_status = deployment.get('status')
-                
-                # Check if deployment name matches expected pattern
-                for group_name in cluster_groups:
-                    expected_name = f"{app_name}-{group_name}"
-                    if dep_name == expected_name:
-                        conflicts.append({
-                            'type': 'naming_conflict',
-                            'deployment_id': deployment.get('id'),
-                            'deployment_name': dep_name,
-                            'status': dep_status,
-                            'application_id': dep_app_id,
-                            'message': f"Deployment {expected_name} already exists with status: {dep_status}"
-                        })
+                conflicts.append({
+                    'type': 'naming_conflict',
+                    'deployment_id': deployment.get('id'),
+                    'deployment_name': expected_name,
+                    'status': dep_status,
+                    'application_id': deployment.get('applicationId'),
+                    'message': f"Deployment {expected_name} already exists with status: {dep_status}"
+                })
             
             return conflicts
         except Exception as e:
@@ -665,9 +918,8 @@ class FleetManagerGitOps:
                     print(f"⚠️  Deployment is in {current_status} state - this may cause issues")
             
             # Attempt to trigger deployment
-            response = requests.post(
+            response = self.session.post(
                 f"{self.fm_api_url}/deployments/{dep_id}/deploy",
-                headers=self.headers,
                 timeout=30
             )
             
@@ -699,31 +951,15 @@ class FleetManagerGitOps:
         """Deploy the application to clusters"""
         try:
             # First, find the deployment for this application
-            response = requests.get(
-                f"{self.fm_api_url}/deployments?limit=200",
-                headers=self.headers,
-                timeout=30
-            )
-            if response.status_code >= 400:
-                self._debug_fail(response, "List deployments GET /deployments")
-                response.raise_for_status()
-            
-            deployments = response.json().get('items', [])
-            deployment_id = None
-            
-            for deployment in deployments:
-                if deployment.get('name') == app_name:
-                    deployment_id = deployment.get('id')
-                    break
+            deployment_id = self.find_deployment(app_name)
             
             if not deployment_id:
                 print(f"❌ No deployment found for application: {app_name}")
                 return False
             
             # Trigger deployment using POST (as shown in your examples)
-            response = requests.post(
+            response = self.session.post(
                 f"{self.fm_api_url}/deployments/{deployment_id}/deploy",
-                headers=self.headers,
                 timeout=30
             )
             if response.status_code >= 400:
@@ -737,11 +973,27 @@ class FleetManagerGitOps:
             print(f"❌ Error deploying application {app_name}: {e}")
             return False
 
-    def process_manifest(self, file_path: str) -> bool:
-        """Process a single manifest file with enhanced controls"""
+    def process_manifest(self, file_path: str, manifest: Dict[str, Any] = None, manifest_yaml: str = None) -> bool:
+        """Process a single manifest file with enhanced controls
+
+        manifest / manifest_yaml may be passed in when the caller already holds the
+        parsed and raw content, in which case file_path is only used as a label and
+        does not need to exist on disk.
+        """
         print(f"\n📄 Processing: {file_path}")
         
-        manifest = self.load_manifest(file_path)
+        fingerprint = None
+        if manifest is None:
+            # Read the file once: the same text is parsed here and sent verbatim as sourceConfig
+            if manifest_yaml is None:
+                manifest_yaml = self.load_manifest_raw(file_path)
+                if manifest_yaml is None:
+                    return False
+            try:
+                manifest, fingerprint = self._parse_yaml_cached(manifest_yaml)
+            except Exception as e:
+                print(f"❌ Error loading {file_path}: {e}")
+                return False
         if not manifest:
             return False
             
@@ -772,9 +1024,16 @@ class FleetManagerGitOps:
         
         # Check for destructive changes if application exists
         existing_app = self.get_deployment_application(app_name)
-        if existing_app and existing_app.get('sourceConfig'):
+        existing_fingerprint = None
+        existing_source = existing_app.get('sourceConfig') if existing_app else None
+        # Stored config textually identical to this manifest: nothing can be destructive or changed
+        source_unchanged = bool(existing_source) and manifest_yaml is not None and (
+            existing_source == manifest_yaml
+            or _canonical_text(existing_source) == _canonical_text(manifest_yaml)
+        )
+        if existing_source and not source_unchanged:
             try:
-                existing_manifest = yaml.safe_load(existing_app.get('sourceConfig'))
+                existing_manifest, existing_fingerprint = self._parse_yaml_cached(existing_app.get('sourceConfig'))
                 warnings = self.detect_destructive_changes(app_name, manifest, existing_manifest)
                 
                 if warnings:
@@ -797,53 +1056,29 @@ class FleetManagerGitOps:
             return True  # Skip but don't fail
         
         # Load raw YAML content to preserve comments
-        manifest_yaml = self.load_manifest_raw(file_path)
+        if manifest_yaml is None:
+            manifest_yaml = self.load_manifest_raw(file_path)
         if not manifest_yaml:
             return False
-            
-        # Also normalize the parsed manifest for comparison purposes
-        manifest_normalized = self._normalize_manifest_structure(manifest)
 
         # Determine target cluster group name(s) from manifest or defaults
-        group_names: List[str] = []
-        md = manifest.get('metadata', {}) or {}
-        sp = manifest.get('spec', {}) or {}
-
-        # Preferred in metadata: list or single
-        if isinstance(md.get('clusterGroups'), list):
-            group_names = [str(x) for x in md.get('clusterGroups') if x]
-        elif md.get('clusterGroup'):
-            group_names = [str(md.get('clusterGroup'))]
-
-        # Fallback to spec
-        if not group_names:
-            if isinstance(sp.get('clusterGroups'), list):
-                group_names = [str(x) for x in sp.get('clusterGroups') if x]
-            elif sp.get('clusterGroup'):
-                group_names = [str(sp.get('clusterGroup'))]
-
-        # Annotations support (comma-separated or single)
-        if not group_names:
-            annotations = md.get('annotations', {}) or {}
-            ann_multi = annotations.get('fleet.scalecomputing.com/cluster-groups')
-            ann_single = annotations.get('fleet.scalecomputing.com/cluster-group')
-            if ann_multi:
-                group_names = [x.strip() for x in str(ann_multi).split(',') if x.strip()]
-            elif ann_single:
-                group_names = [str(ann_single)]
-
-        # Env/default fallback
-        if not group_names:
-            group_names = [self.default_cluster_group_name]
+        group_names = self._extract_cluster_groups(manifest) or [self.default_cluster_group_name]
         
         # Get application ID (existing_app already retrieved earlier)
         app_id = existing_app.get('id') if existing_app else None
 
         content_changed = True
-        if existing_app and existing_app.get('sourceConfig'):
+        if source_unchanged:
+            content_changed = False
+        elif fingerprint is not None and existing_fingerprint is not None:
+            # Both sides came through the manifest cache; compare the stored fingerprints
+            content_changed = fingerprint != existing_fingerprint
+        elif existing_app and existing_app.get('sourceConfig'):
             try:
-                existing_yaml = yaml.safe_load(existing_app.get('sourceConfig'))
+                existing_yaml = yaml.load(existing_app.get('sourceConfig'), Loader=_Loader)
                 existing_yaml = self._normalize_manifest_structure(existing_yaml)
+                # Only normalize our side when the cached fingerprints could not settle it
+                manifest_normalized = self._normalize_manifest_structure(manifest)
                 # Compare normalized structures to avoid formatting/ordering diffs
                 content_changed = (
                     self._normalize(existing_yaml) != self._normalize(manifest_normalized)
@@ -890,50 +1125,125 @@ class FleetManagerGitOps:
             print(f"   Available cluster groups: {', '.join(name_to_id.keys())}")
             return False
 
-        all_ok = True
         # Use manifest's top-level version if present; default "1"
         app_version = str(manifest.get('version', '1'))
 
-        for group_name in group_names:
+        def deploy_group(group_name: str) -> bool:
             group_id = name_to_id[group_name]
             deployment_name = f"{app_name}-{group_name}"
             print(f"🔍 Processing deployment: {deployment_name}")
             
             dep_id = self.find_deployment(deployment_name)
-            created = False
             if dep_id:
                 print(f"📋 Found existing deployment: {deployment_name} (ID: {dep_id})")
                 # Only trigger release if app content changed
-                ok = True
                 if content_changed:
                     print(f"🔄 Content changed, triggering deployment release...")
-                    released = self.trigger_deployment_release(dep_id, deployment_name)
-                    all_ok = all_ok and released
-                else:
-                    print(f"ℹ️  No content changes, skipping deployment trigger")
-            else:
-                print(f"✨ Creating new deployment: {deployment_name}")
-                dep_id = self.create_deployment(app_id, deployment_name, group_id, app_name, app_version)
-                ok = dep_id is not None
-                created = ok and dep_id is not None
-                
-                # Track deployment for monitoring
-                if created and self.monitor_deployments:
-                    self.created_deployments.append({
-                        'id': dep_id,
-                        'name': deployment_name,
-                        'app_name': app_name,
-                        'cluster_group': group_name
-                    })
-            all_ok = all_ok and ok
+                    return self.trigger_deployment_release(dep_id, deployment_name)
+                print(f"ℹ️  No content changes, skipping deployment trigger")
+                return True
+
+            print(f"✨ Creating new deployment: {deployment_name}")
+            dep_id = self.create_deployment(app_id, deployment_name, group_id, app_name, app_version)
+            if dep_id is None:
+                return False
+            
+            # Track deployment for monitoring
+            if self.monitor_deployments:
+                self.created_deployments.append({
+                    'id': dep_id,
+                    'name': deployment_name,
+                    'app_name': app_name,
+                    'cluster_group': group_name
+                })
 
             # For newly created deployment, trigger release immediately
-            if created and dep_id:
-                print(f"🚀 Triggering initial deployment release for new deployment...")
-                released = self.trigger_deployment_release(dep_id, deployment_name)
-                all_ok = all_ok and released
+            print(f"🚀 Triggering initial deployment release for new deployment...")
+            return self.trigger_deployment_release(dep_id, deployment_name)
+
+        # Each cluster group's deployment is independent; roll them out concurrently.
+        # Duplicates are dropped so two workers never race to create the same deployment.
+        group_names = list(dict.fromkeys(group_names))
+        if len(group_names) == 1:
+            return deploy_group(group_names[0])
+        if isinstance(sys.stdout, _ManifestOutput):
+            deploy_group = sys.stdout.bind(deploy_group)
+        with ThreadPoolExecutor(max_workers=min(GROUP_PARALLELISM, len(group_names))) as executor:
+            return all(list(executor.map(deploy_group, group_names)))
+
+    def _discover_container_files(self, containers_dir: str = 'manifests/containers') -> List[str]:
+        """ContainerDefinition files: *.container.yaml plus any other YAML declaring that type
 
-        return all_ok
+        The result is remembered per instance and rescanned only when the directory's mtime
+        changes, i.e. when files are added, removed or renamed in it.
+        """
+        try:
+            key = (containers_dir, os.stat(containers_dir).st_mtime_ns)
+        except FileNotFoundError:
+            return []
+        cached = self._container_files
+        if cached and cached[0] == key:
+            return list(cached[1])
+
+        try:
+            with os.scandir(containers_dir) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.endswith('.yaml') and not e.name.startswith('.') and e.is_file()
+                )
+        except FileNotFoundError:
+            return []
+
+        container_files = []
+        for name in names:
+            path = f"{containers_dir}/{name}"
+            if name.endswith('.container.yaml'):
+                container_files.append(path)
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                # Files that never mention the type cannot declare it; only parse the rest to confirm
+                if b'ContainerDefinition' not in raw:
+                    continue
+                content = self._parse_yaml_cached(raw.decode('utf-8'))[0]
+                if content and content.get('type') == 'ContainerDefinition':
+                    container_files.append(path)
+            except Exception:
+                continue  # Skip files that can't be parsed
+        # Runtime configs live under the containers dir; compiled output sits beside it
+        compiled_dir = os.path.join(os.path.dirname(containers_dir), '_compiled')
+        targets = []
+        for path in container_files:
+            name = Path(path).stem.replace('.container', '')
+            targets.append((
+                path,
+                f'{containers_dir}/runtime_configuration/{name}.runtime.yaml',
+                f'{compiled_dir}/{name}.yaml',
+            ))
+        self._container_files = (key, container_files, targets)
+        return list(container_files)
+
+    def _container_targets(self, containers_dir: str = 'manifests/containers') -> List[Tuple[str, str, str]]:
+        """(container file, per-app runtime file, compiled output) for each ContainerDefinition"""
+        if not self._discover_container_files(containers_dir):
+            return []
+        return list(self._container_files[2])
+
+    def _map_manifests(self, fn, file_paths: List[str]) -> List[Any]:
+        """Apply fn to each manifest path concurrently, printing each one's output as a single block"""
+        output = _ManifestOutput(sys.stdout)
+
+        def call(file_path: str):
+            with output.capture():
+                return fn(file_path)
+
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=min(DEPLOY_PARALLELISM, len(file_paths))) as executor:
+                return list(executor.map(call, file_paths))
+        finally:
+            sys.stdout = output._stream
 
     def run(self):
         """Main deployment process with enhanced controls"""
@@ -959,9 +1269,8 @@ class FleetManagerGitOps:
         
         # Test connection to Fleet Manager API
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.fm_api_url}/clusters",
-                headers=self.headers,
                 timeout=10
             )
             if response.status_code == 200:
@@ -973,11 +1282,13 @@ class FleetManagerGitOps:
             print(f"❌ Fleet Manager API connection error: {e}")
             return False
         
-        # Get changed files
+        # Get changed files. git listings exclude deletions (--diff-filter=d) and the event
+        # payload is replayed with removals; this only catches paths deleted locally since.
         changed_files = self.get_changed_files()
-        # Skip files that were deleted (can appear in event payload)
-        existing_changed_files = [f for f in changed_files if os.path.exists(f)]
-        missing_files = [f for f in changed_files if not os.path.exists(f)]
+        existing_changed_files: List[str] = []
+        missing_files: List[str] = []
+        for f in changed_files:
+            (existing_changed_files if os.path.exists(f) else missing_files).append(f)
         if missing_files:
             print(f"ℹ️  Skipping deleted files: {', '.join(missing_files)}")
         changed_files = existing_changed_files
@@ -991,34 +1302,16 @@ class FleetManagerGitOps:
         try:
             # Remove any compiled paths from the raw change list (we'll re-add selectively)
             changed_files = [f for f in changed_files if not f.startswith('manifests/_compiled/')]
+            changed_set = set(changed_files)
 
             generic_runtime = 'manifests/containers/runtime_configuration/runtime.yaml'
             
-            # Find container definition files by extension first
-            container_files = glob.glob('manifests/containers/*.container.yaml')
-            
-            # Also find any YAML files that contain ContainerDefinition type
-            all_yaml_files = glob.glob('manifests/containers/*.yaml')
-            for yaml_file in all_yaml_files:
-                try:
-                    with open(yaml_file, 'r') as f:
-                        content = yaml.safe_load(f)
-                        if content and content.get('type') == 'ContainerDefinition':
-                            if yaml_file not in container_files:
-                                container_files.append(yaml_file)
-                except Exception:
-                    continue  # Skip files that can't be parsed
-            
             compiled_to_add: List[str] = []
             container_sources_changed = False
             
-            for cfile in container_files:
-                name = Path(cfile).stem.replace('.container', '')
-                per_app_runtime = f'manifests/containers/runtime_configuration/{name}.runtime.yaml'
-                compiled_path = f'manifests/_compiled/{name}.yaml'
-                
+            for cfile, per_app_runtime, compiled_path in self._container_targets():
                 # If any of the sources changed in this run, include its compiled output
-                if any(src in changed_files for src in [cfile, per_app_runtime, generic_runtime]):
+                if cfile in changed_set or per_app_runtime in changed_set or generic_runtime in changed_set:
                     container_sources_changed = True
                     if os.path.exists(compiled_path):
                         compiled_to_add.append(compiled_path)
@@ -1034,7 +1327,8 @@ class FleetManagerGitOps:
 
             # Add compiled files to the change list
             for p in compiled_to_add:
-                if p not in changed_files:
+                if p not in changed_set:
+                    changed_set.add(p)
                     changed_files.append(p)
                     
         except Exception as e:
@@ -1055,11 +1349,10 @@ class FleetManagerGitOps:
             except Exception:
                 application_files.append(cf)
 
-        # Process each Application file
+        # Process Application files concurrently; they are independent and network-bound
         success_count = 0
-        for file_path in application_files:
-            if self.process_manifest(file_path):
-                success_count += 1
+        if application_files:
+            success_count = sum(1 for ok in self._map_manifests(self.process_manifest, application_files) if ok)
         
         print(f"\n📊 Deployment Summary:")
         print(f"✅ Successful: {success_count}")
@@ -1096,6 +1389,8 @@ if __name__ == "__main__":
     parser.add_argument('--skip-deployment-trigger', action='store_true', help='Update applications but do not trigger deployments')
     parser.add_argument('--diagnostic', action='store_true', help='Enable enhanced error checking and conflict detection')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be deployed without making changes')
+    parser.add_argument('--max-parallel', type=int, default=DEPLOY_PARALLELISM,
+                        help=f'Manifests processed concurrently (default {DEPLOY_PARALLELISM}, env FM_DEPLOY_PARALLELISM)')
     
     args = parser.parse_args()
     
@@ -1108,6 +1403,7 @@ if __name__ == "__main__":
         os.environ['SKIP_DEPLOYMENT_TRIGGER'] = 'true'
     if args.diagnostic:
         os.environ['DIAGNOSTIC_MODE'] = 'true'
+    DEPLOY_PARALLELISM = max(1, args.max_parallel)
     
     try:
         deployer = FleetManagerGitOps()
@@ -13,28 +13,47 @@ Now properly checks sourceConfig field, handles multiple applications per deploy
 and detects stuck deployment releases via the deployment-releases API endpoint.
 """
 
+import functools
 import os
 import sys
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Set
+from urllib3.util.retry import Retry
+
+# Retry transient gateway failures; a 500 is left alone because it marks a deleted application
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+@functools.lru_cache(maxsize=None)
+def _session() -> requests.Session:
+    """One pooled keep-alive session shared by every API call in this script"""
+    session = requests.Session()
+    session.headers.update({
+        'accept': 'application/json',
+        'api-key': os.getenv('SC_FM_APIKEY')
+    })
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=RETRY_POLICY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 def get_all_deployments() -> List[Dict[str, Any]]:
     """Get all deployments"""
-    api_key = os.getenv('SC_FM_APIKEY')
     api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
-    
     deployments = []
     url = f"{api_url}/deployments?limit=50"
     
     while url:
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _session().get(url, timeout=30)
             response.raise_for_status()
             data = response.json()
             deployments.extend(data.get('items', []))
@@ -47,16 +66,10 @@ def get_all_deployments() -> List[Dict[str, Any]]:
 
 def get_deployment_details(dep_id: str) -> Dict[str, Any]:
     """Get full details for a specific deployment"""
-    api_key = os.getenv('SC_FM_APIKEY')
     api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
-    
     try:
-        response = requests.get(f"{api_url}/deployments/{dep_id}", headers=headers, timeout=30)
+        response = _session().get(f"{api_url}/deployments/{dep_id}", timeout=30)
         if response.status_code == 200:
             return response.json()
         else:
@@ -66,21 +79,15 @@ def get_deployment_details(dep_id: str) -> Dict[str, Any]:
 
 def get_deployment_releases(dep_id: str) -> List[Dict[str, Any]]:
     """Get deployment releases for a specific deployment"""
-    api_key = os.getenv('SC_FM_APIKEY')
     api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
-    
     try:
         # Get deployment releases with pagination and filter by deploymentId
         releases = []
         url = f"{api_url}/deployment-releases?deploymentId={dep_id}&limit=50"
         
         while url:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _session().get(url, timeout=30)
             if response.status_code == 200:
                 data = response.json()
                 batch = data.get('items', [])
@@ -105,16 +112,10 @@ def get_deployment_releases(dep_id: str) -> List[Dict[str, Any]]:
 
 def get_application_details(app_id: str) -> Dict[str, Any]:
     """Get full details for a specific application"""
-    api_key = os.getenv('SC_FM_APIKEY')
     api_url = os.getenv('FLEET_MANAGER_API_URL', 'https://api.scalecomputing.com/api/v2')
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key
-    }
-    
     try:
-        response = requests.get(f"{api_url}/deployment-applications/{app_id}", headers=headers, timeout=30)
+        response = _session().get(f"{api_url}/deployment-applications/{app_id}", timeout=30)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 500:
@@ -8,8 +8,19 @@ import sys
 import time
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from urllib3.util.retry import Retry
+
+# Retry gateway errors and 429s between polls
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
 
 class DeploymentReleaseMonitor:
     def __init__(self):
@@ -26,12 +37,19 @@ class DeploymentReleaseMonitor:
             'Accept': 'application/json'
         }
 
+        # Pooled session reused across polls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=RETRY_POLICY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def get_deployment_releases(self, deployment_id: str) -> List[Dict[str, Any]]:
         """Get all releases for a specific deployment"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.fm_api_url}/deployments/{deployment_id}/releases",
-                headers=self.headers
+                timeout=30
             )
             response.raise_for_status()
             return response.json()
@@ -42,9 +60,9 @@ class DeploymentReleaseMonitor:
     def get_deployment_details(self, deployment_id: str) -> Optional[Dict[str, Any]]:
         """Get deployment details"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.fm_api_url}/deployments/{deployment_id}",
-                headers=self.headers
+                timeout=30
             )
             response.raise_for_status()
             return response.json()
@@ -55,9 +73,9 @@ class DeploymentReleaseMonitor:
     def get_release_jobs(self, release_id: str) -> List[Dict[str, Any]]:
         """Get jobs for a specific release"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.fm_api_url}/deployment-releases/{release_id}/jobs",
-                headers=self.headers
+                timeout=30
             )
             response.raise_for_status()
             return response.json()
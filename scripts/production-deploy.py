@@ -8,11 +8,13 @@ import sys
 import yaml
 import subprocess
 
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def is_production_manifest(manifest_path: str) -> bool:
     """Check if a manifest is suitable for production deployment"""
     
     with open(manifest_path, 'r') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_Loader)
     
     # Check if it's a test manifest
     app_name = manifest.get('metadata', {}).get('name', '')
@@ -9,12 +9,14 @@ import yaml
 import shutil
 import subprocess
 
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def create_test_manifest(manifest_path: str, test_cluster_group: str = "dd_szt15b") -> str:
     """Create a test version of the manifest"""
     
     # Read original manifest
     with open(manifest_path, 'r') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_Loader)
     
     # Create test version
     test_manifest = manifest.copy()
@@ -82,7 +84,7 @@ def deploy_test_manifest(manifest_path: str, test_cluster_group: str = "dd_szt15
         
         # Get the application name from the test manifest
         with open(test_manifest_path, 'r') as f:
-            test_manifest = yaml.safe_load(f)
+            test_manifest = yaml.load(f, Loader=_Loader)
         app_name = test_manifest.get('metadata', {}).get('name', 'unknown')
         
         # Set environment for test deployment
@@ -11,6 +11,8 @@ import glob
 from pathlib import Path
 from typing import Dict, List, Any
 
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 class ManifestValidator:
     def __init__(self):
         self.required_fields = {
@@ -29,7 +31,7 @@ class ManifestValidator:
         """Validate YAML syntax"""
         try:
             with open(file_path, 'r') as f:
-                yaml.safe_load(f)
+                yaml.load(f.read(), Loader=_Loader)
             return True
         except yaml.YAMLError as e:
             print(f"❌ YAML syntax error in {file_path}: {e}")
@@ -89,7 +91,7 @@ class ManifestValidator:
         # Load and validate structure
         try:
             with open(file_path, 'r') as f:
-                manifest = yaml.safe_load(f)
+                manifest = yaml.load(f.read(), Loader=_Loader)
             # Skip non-Application manifests (e.g., ContainerDefinition, RuntimeConfiguration)
             mtype = str(manifest.get('type', '')).lower() if isinstance(manifest, dict) else ''
             if mtype != 'application':
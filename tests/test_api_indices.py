@@ -0,0 +1,111 @@
+"""Tests for the per-run application/deployment name indexes in deploy.py."""
+
+import json
+import os
+import sys
+import pytest
+import responses
+
+# Add scripts/ to path so we can import deploy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+API = 'https://fm.example/api/v2'
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    """Set required env vars so FleetManagerGitOps can be instantiated."""
+    monkeypatch.setenv('SC_FM_APIKEY', 'dummy')
+    monkeypatch.setenv('FLEET_MANAGER_API_URL', API)
+
+
+@pytest.fixture
+def fm():
+    from deploy import FleetManagerGitOps
+    return FleetManagerGitOps()
+
+
+@pytest.fixture
+def api():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, f'{API}/deployment-applications', json={
+            'items': [{'id': 'app-1', 'name': 'web', 'sourceConfig': 'type: Application'}],
+            'next': f'{API}/deployment-applications?cursor=2',
+        })
+        rsps.add(responses.GET, f'{API}/deployment-applications?cursor=2', json={
+            'items': [{'id': 'app-2', 'name': 'db'}],
+        })
+        rsps.add(responses.GET, f'{API}/deployments', json={
+            'items': [{'id': 'dep-1', 'name': 'web-GroupA'}],
+        })
+        yield rsps
+
+
+def _list_calls(rsps):
+    return [c for c in rsps.calls if c.request.method == 'GET']
+
+
+class TestIndexes:
+    def test_lookups_follow_pagination(self, fm, api):
+        assert fm.get_deployment_application('db')['id'] == 'app-2'
+        assert fm.find_deployment_application('web') == 'app-1'
+        assert fm.find_deployment('web-GroupA') == 'dep-1'
+        assert fm.find_deployment('missing') is None
+
+    def test_listings_fetched_once(self, fm, api):
+        for _ in range(3):
+            fm.get_deployment_application('web')
+            fm.find_deployment('web-GroupA')
+        # Two application pages plus one deployments page, regardless of lookup count
+        assert len(_list_calls(api)) == 3
+
+    def test_created_objects_are_indexed(self, fm, api):
+        api.add(responses.POST, f'{API}/deployment-applications', json={'id': 'app-3'})
+        api.add(responses.POST, f'{API}/deployments', json={'id': 'dep-2'})
+        fm.get_deployment_application('web')
+
+        assert fm.create_deployment_application('cache', 'type: Application') == 'app-3'
+        assert fm.create_deployment('app-3', 'cache-GroupA', 'cg-1', 'cache') == 'dep-2'
+        assert fm.find_deployment_application('cache') == 'app-3'
+        assert fm.find_deployment('cache-GroupA') == 'dep-2'
+        assert len(_list_calls(api)) == 3
+
+    def test_request_bodies_are_json(self, fm, api):
+        api.add(responses.POST, f'{API}/deployment-applications', json={'id': 'app-3'})
+        manifest = 'type: Application\nuser_data: |\n  echo "→ done"\n'
+        fm.create_deployment_application('cache', manifest)
+
+        request = [c.request for c in api.calls if c.request.method == 'POST'][0]
+        assert request.headers['content-type'] == 'application/json'
+        assert json.loads(request.body)['sourceConfig'] == manifest
+
+    def test_updated_source_config_replaces_cached_copy(self, fm, api):
+        api.add(responses.PUT, f'{API}/deployment-applications/app-1', json={})
+        fm.get_deployment_application('web')
+
+        assert fm.update_deployment_application('app-1', 'web', 'type: Application\nversion: 2')
+        app = fm.get_deployment_application('web')
+        assert app['id'] == 'app-1'
+        assert app['sourceConfig'] == 'type: Application\nversion: 2'
+
+    def test_conflicts_found_by_expected_name(self, fm, api):
+        conflicts = fm.check_deployment_conflicts('web', ['GroupA', 'GroupB'])
+        assert [c['deployment_id'] for c in conflicts] == ['dep-1']
+        assert conflicts[0]['deployment_name'] == 'web-GroupA'
+
+    def test_cluster_groups_listed_once_across_pages(self, fm, api):
+        api.add(responses.GET, f'{API}/cluster-groups', json={
+            'items': [{'id': 'cg-1', 'name': 'GroupA'}],
+            'next': f'{API}/cluster-groups?cursor=2',
+        })
+        api.add(responses.GET, f'{API}/cluster-groups?cursor=2', json={
+            'items': [{'id': 'cg-2', 'name': 'GroupB'}],
+        })
+        for _ in range(3):
+            assert fm.list_cluster_groups() == {'GroupA': 'cg-1', 'GroupB': 'cg-2'}
+        assert len(_list_calls(api)) == 2
+
+    def test_listing_failure_returns_none(self, fm):
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, f'{API}/deployment-applications', status=403)
+            assert fm.get_deployment_application('web') is None
@@ -0,0 +1,32 @@
+"""Tests for the canonical source text used to spot unchanged manifests."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from deploy import _canonical_text
+
+
+class TestCanonicalText:
+    """Test deploy._canonical_text (cheap pre-check before the semantic compare)."""
+
+    def test_line_endings_ignored(self):
+        assert _canonical_text('a: 1\r\nb: |\r\n  x\r\n') == _canonical_text('a: 1\nb: |\n  x\n')
+        assert _canonical_text('a: 1\rb: 2\r') == 'a: 1\nb: 2\n'
+
+    def test_trailing_spaces_inside_lines_are_significant(self):
+        assert _canonical_text('b: |\n  x  \n') != _canonical_text('b: |\n  x\n')
+
+    def test_keep_chomped_trailing_newlines_are_significant(self):
+        import yaml
+        kept_extra, kept = 'a: |+\n  x\n\n', 'a: |+\n  x\n'
+        assert yaml.safe_load(kept_extra) != yaml.safe_load(kept)
+        assert _canonical_text(kept_extra) != _canonical_text(kept)
+        assert _canonical_text('a: >2+\r\n  x\r\n') == 'a: >2+\n  x\n'
+
+    def test_final_newline_of_clip_block_at_eof_is_significant(self):
+        import yaml
+        without, with_newline = 'meta_data: |\n  foo', 'meta_data: |\n  foo\n'
+        assert yaml.safe_load(without) != yaml.safe_load(with_newline)
+        assert _canonical_text(without) != _canonical_text(with_newline)
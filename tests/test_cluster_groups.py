@@ -0,0 +1,33 @@
+"""Tests for cluster group extraction from manifests."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from deploy import FleetManagerGitOps
+
+
+class TestExtractClusterGroups:
+    """Test FleetManagerGitOps._extract_cluster_groups (staticmethod)."""
+
+    def test_metadata_list_preferred_over_spec(self):
+        manifest = {
+            'metadata': {'clusterGroups': ['A', None, 'B']},
+            'spec': {'clusterGroup': 'C'},
+        }
+        assert FleetManagerGitOps._extract_cluster_groups(manifest) == ['A', 'B']
+
+    def test_empty_metadata_list_falls_back_to_spec(self):
+        manifest = {'metadata': {'clusterGroups': [None]}, 'spec': {'clusterGroup': 'C'}}
+        assert FleetManagerGitOps._extract_cluster_groups(manifest) == ['C']
+
+    def test_annotations_comma_separated(self):
+        manifest = {'metadata': {'annotations': {
+            'fleet.scalecomputing.com/cluster-groups': 'A, B,',
+            'fleet.scalecomputing.com/cluster-group': 'C',
+        }}}
+        assert FleetManagerGitOps._extract_cluster_groups(manifest) == ['A', 'B']
+
+    def test_nothing_declared(self):
+        assert FleetManagerGitOps._extract_cluster_groups({'metadata': {'name': 'x'}}) == []
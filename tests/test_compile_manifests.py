@@ -3,9 +3,11 @@
 import os
 import sys
 
+import yaml
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
-from compile_manifests import _meta_data, to_application
+from compile_manifests import LiteralString, _compile_one, _meta_data, to_application
 
 
 # ---------------------------------------------------------------------------
@@ -106,8 +108,108 @@ class TestToApplication:
         assert 'user_data' in cloud_init
         assert 'meta_data' in cloud_init
 
-    def test_rendered_user_data_key_present(self):
-        """to_application attaches __rendered_user_data__ for later YAML emission."""
+    def test_runtime_cloud_init_takes_precedence(self):
+        container_def = self._container_def()
+        container_def['spec']['cloudInit'] = {'ssh': {'passwordAuth': True}}
+        container_def['spec']['chpasswd'] = {'list': 'user:pw', 'expire': False}
+        runtime_def = {'spec': {'cloudInit': {'ssh': {'passwordAuth': False}}}}
+        app = to_application(container_def, runtime_def)
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        assert 'ssh_pwauth: false' in user_data
+        assert 'user:pw' in user_data
+
+    def test_user_data_is_valid_yaml_with_special_characters(self):
+        container_def = self._container_def()
+        container_def['spec']['users'] = [
+            {'name': 'ops', 'shell': '/bin/bash', 'sudo': 'ALL=(ALL) NOPASSWD:ALL',
+             'sshAuthorizedKeys': ['ssh-ed25519 AAAA #comment: with colon']},
+        ]
+        app = to_application(container_def, self._runtime_def())
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        parsed = yaml.safe_load(user_data)
+        assert parsed['users'][0]['ssh-authorized-keys'] == ['ssh-ed25519 AAAA #comment: with colon']
+        assert 'systemctl daemon-reload' in parsed['runcmd']
+
+    def test_user_data_keeps_established_layout(self):
+        """Sequences stay indented and groups inline, so existing apps are not seen as changed."""
+        container_def = self._container_def()
+        container_def['spec']['users'] = [{'name': 'ops', 'groups': ['wheel', 'adm']}]
+        app = to_application(container_def, self._runtime_def())
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        assert 'users:\n  - name: ops\n    groups: [wheel, adm]\n' in user_data
+        assert '\nruncmd:\n  - ' in user_data
+
+    def test_tabs_and_trailing_spaces_stay_in_literal_blocks(self):
+        container_def = self._container_def()
+        container_def['spec']['content'] = [{'path': '/etc/demo.sh', 'data': 'run() {\n\techo hi  \n}\n'}]
+        app = to_application(container_def, self._runtime_def())
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        assert "  - |\n    cat <<'EOF' > /etc/demo.sh\n    run() {\n    \techo hi  \n    }\n    EOF\n" in user_data
+        heredoc = [c for c in yaml.safe_load(user_data)['runcmd'] if '/etc/demo.sh' in c][0]
+        assert '\techo hi  \n' in heredoc
+
+    def test_only_values_that_need_it_are_quoted(self):
+        container_def = self._container_def()
+        container_def['spec']['users'] = [
+            {'name': 'ops', 'groups': ['wheel', 'a,b'], 'sudo': 'ALL=(ALL) NOPASSWD:ALL',
+             'sshAuthorizedKeys': ['ssh-ed25519 AAAA #comment: with colon', 'github:ops']},
+        ]
+        app = to_application(container_def, self._runtime_def())
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        assert '    groups: [wheel, "a,b"]\n    sudo: ALL=(ALL) NOPASSWD:ALL\n' in user_data
+        assert '      - "ssh-ed25519 AAAA #comment: with colon"\n      - github:ops\n' in user_data
+        assert yaml.safe_load(user_data)['users'][0]['groups'] == ['wheel', 'a,b']
+
+    def test_user_data_is_literal_string(self):
+        """user_data is attached as a LiteralString so the dumper emits a | block."""
         app = to_application(self._container_def(), self._runtime_def())
-        assert '__rendered_user_data__' in app
-        assert '#cloud-config' in app['__rendered_user_data__']
+        user_data = app['spec']['resources'][0]['spec']['cloud_init_data']['user_data']
+        assert '__rendered_user_data__' not in app
+        assert isinstance(user_data, LiteralString)
+        assert user_data.startswith('#cloud-config')
+
+
+# ---------------------------------------------------------------------------
+# _compile_one (incremental rebuild)
+# ---------------------------------------------------------------------------
+
+class TestCompileOneIncremental:
+    @staticmethod
+    def _write_container(path, image='docker.io/library/nginx:1.27-alpine'):
+        path.write_text(
+            "type: ContainerDefinition\n"
+            "metadata:\n"
+            "  name: demo\n"
+            "spec:\n"
+            "  containers:\n"
+            "    - name: web\n"
+            f"      image: {image}\n"
+        )
+
+    def test_unchanged_inputs_are_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cfile = tmp_path / 'demo.container.yaml'
+        self._write_container(cfile)
+        out_dir = tmp_path / 'out'
+        out_dir.mkdir()
+
+        name, out_path, compiled = _compile_one(str(cfile), out_dir)
+        assert (name, compiled) == ('demo', True)
+        assert out_path.exists()
+        assert (out_dir / 'demo.yaml.stamp').exists()
+
+        assert _compile_one(str(cfile), out_dir)[2] is False
+        assert _compile_one(str(cfile), out_dir, force=True)[2] is True
+
+    def test_changed_input_recompiles(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cfile = tmp_path / 'demo.container.yaml'
+        self._write_container(cfile)
+        out_dir = tmp_path / 'out'
+        out_dir.mkdir()
+
+        _compile_one(str(cfile), out_dir)
+        self._write_container(cfile, image='docker.io/library/nginx:1.28-alpine')
+        _, out_path, compiled = _compile_one(str(cfile), out_dir)
+        assert compiled is True
+        assert '1.28-alpine' in out_path.read_text()
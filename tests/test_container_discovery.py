@@ -0,0 +1,58 @@
+"""Tests for ContainerDefinition file discovery."""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+
+@pytest.fixture
+def fm(monkeypatch, tmp_path):
+    import deploy
+    monkeypatch.setenv('SC_FM_APIKEY', 'dummy')
+    monkeypatch.setattr(deploy, 'MANIFEST_CACHE_DIR', tmp_path / 'cache')
+    return deploy.FleetManagerGitOps()
+
+
+class TestContainerTargets:
+    """Test FleetManagerGitOps._container_targets (discovery memoized on directory mtime)."""
+
+    def test_paths_derived_from_containers_dir(self, fm, tmp_path):
+        containers = tmp_path / 'manifests' / 'containers'
+        containers.mkdir(parents=True)
+        (containers / 'web.container.yaml').write_text('type: ContainerDefinition\n')
+        (containers / 'extra.yaml').write_text('type: ContainerDefinition\n')
+        (containers / 'other.yaml').write_text('type: Application\n')
+
+        assert fm._container_targets(str(containers)) == [
+            (f'{containers}/extra.yaml',
+             f'{containers}/runtime_configuration/extra.runtime.yaml',
+             f'{tmp_path}/manifests/_compiled/extra.yaml'),
+            (f'{containers}/web.container.yaml',
+             f'{containers}/runtime_configuration/web.runtime.yaml',
+             f'{tmp_path}/manifests/_compiled/web.yaml'),
+        ]
+
+    def test_rescans_only_when_directory_changes(self, fm, tmp_path, monkeypatch):
+        import deploy
+        scans = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+        monkeypatch.setattr(deploy.os, 'scandir', counting_scandir)
+
+        containers = tmp_path / 'containers'
+        containers.mkdir()
+        (containers / 'web.container.yaml').write_text('type: ContainerDefinition\n')
+        os.utime(containers, ns=(1, 1))
+        assert len(fm._container_targets(str(containers))) == 1
+        assert len(fm._container_targets(str(containers))) == 1
+        assert len(scans) == 1
+
+        (containers / 'db.container.yaml').write_text('type: ContainerDefinition\n')
+        os.utime(containers, ns=(2, 2))
+        assert len(fm._container_targets(str(containers))) == 2
+        assert len(scans) == 2
@@ -0,0 +1,68 @@
+"""Tests for the on-disk manifest parse cache."""
+
+import os
+import sys
+import copy
+import hashlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from deploy import FleetManagerGitOps
+
+
+class TestParseYamlCached:
+    """Test FleetManagerGitOps._parse_yaml_cached (on-disk parse cache)."""
+
+    MANIFEST = (
+        "type: Application\n"
+        "metadata:\n"
+        "  name: web\n"
+        "  labels: {env: prod}\n"
+    )
+
+    @staticmethod
+    def _fm(monkeypatch, tmp_path):
+        import deploy
+        monkeypatch.setenv('SC_FM_APIKEY', 'dummy')
+        monkeypatch.setattr(deploy, 'MANIFEST_CACHE_DIR', tmp_path / 'cache')
+        return FleetManagerGitOps()
+
+    def test_second_parse_is_served_from_cache(self, monkeypatch, tmp_path):
+        import deploy
+        fm = self._fm(monkeypatch, tmp_path)
+        parsed, fingerprint = fm._parse_yaml_cached(self.MANIFEST)
+        assert parsed['metadata']['labels'] == {'env': 'prod'}
+        normalized = fm._normalize(fm._normalize_manifest_structure(copy.deepcopy(parsed)))
+        assert fingerprint == hashlib.sha256(normalized).hexdigest()
+        assert len(list((tmp_path / 'cache').iterdir())) == 1
+
+        def no_yaml(*args, **kwargs):
+            raise AssertionError('YAML should not be re-parsed on a cache hit')
+        monkeypatch.setattr(deploy.yaml, 'load', no_yaml)
+        assert fm._parse_yaml_cached(self.MANIFEST) == (parsed, fingerprint)
+
+    def test_repeat_parse_in_run_returns_fresh_objects(self, monkeypatch, tmp_path):
+        import shutil
+        fm = self._fm(monkeypatch, tmp_path)
+        first, _ = fm._parse_yaml_cached(self.MANIFEST)
+        first['metadata']['name'] = 'mutated'
+        shutil.rmtree(tmp_path / 'cache')
+
+        second, _ = fm._parse_yaml_cached(self.MANIFEST)
+        assert second['metadata']['name'] == 'web'
+
+    def test_content_that_is_not_json_safe_is_not_cached(self, monkeypatch, tmp_path):
+        fm = self._fm(monkeypatch, tmp_path)
+        parsed, fingerprint = fm._parse_yaml_cached("released: 2024-01-01\n1: one\n")
+        assert fingerprint is None
+        assert parsed[1] == 'one'
+        assert not (tmp_path / 'cache').exists()
+
+    def test_integers_wider_than_64_bits_survive(self, monkeypatch, tmp_path):
+        fm = self._fm(monkeypatch, tmp_path)
+        text = "type: Application\nspec:\n  serial: 1180591620717411303424\n"
+        for _ in range(2):
+            parsed, fingerprint = fm._parse_yaml_cached(text)
+            assert parsed['spec']['serial'] == 2 ** 70
+            assert isinstance(parsed['spec']['serial'], int)
+            assert fingerprint is not None